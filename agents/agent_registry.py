@@ -1,7 +1,7 @@
 """Agent registry for descriptor-driven pipeline agents."""
 
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -11,22 +11,58 @@ class AgentRegistry:
 
     def __init__(self):
         self._descriptors: Dict[str, Any] = {}
+        # Bumped whenever the descriptor set changes; keys the info cache.
+        self._version = 0
+        # (version, aggregated catalog, agent_id -> public info) for that version.
+        self._info_cache: Optional[
+            Tuple[int, Dict[str, Any], Dict[str, Dict[str, Any]]]
+        ] = None
+
+    @property
+    def version(self) -> int:
+        """Counter that changes on every register / reload."""
+        return self._version
+
+    @staticmethod
+    def _public_info(agent_id: str, descriptor: Any) -> Dict[str, Any]:
+        return {
+            "id": agent_id,
+            "name": agent_id,
+            "description": (descriptor.catalog_entry or "")[:200],
+            "agent_type": "pipeline",
+            "capabilities": ["pipeline_agent", descriptor.asset_key],
+            "asset_key": descriptor.asset_key,
+        }
 
     def get_all_agents_info(self) -> List[Dict[str, Any]]:
-        infos: List[Dict[str, Any]] = []
-        for agent_id, descriptor in self._descriptors.items():
-            infos.append({
-                "id": agent_id,
-                "name": agent_id,
-                "description": (descriptor.catalog_entry or "")[:200],
-                "agent_type": "pipeline",
-                "capabilities": ["pipeline_agent", descriptor.asset_key],
-                "asset_key": descriptor.asset_key,
-            })
-
-        return infos
+        return [
+            self._public_info(agent_id, descriptor)
+            for agent_id, descriptor in self._descriptors.items()
+        ]
+
+    def _current_info_cache(
+        self,
+    ) -> Tuple[int, Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        cached = self._info_cache
+        if cached is None or cached[0] != self._version:
+            info = self._build_agents_info()
+            by_id = {item["id"]: item for item in info["agents"]}
+            cached = (self._version, info, by_id)
+            self._info_cache = cached
+        return cached
 
     def gather_agents_info(self) -> Dict[str, Any]:
+        """Aggregated catalog, rebuilt only when the registry changes.
+
+        The returned dict is shared between callers and must not be mutated.
+        """
+        return self._current_info_cache()[1]
+
+    def get_agent_info(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """Public info for one agent (the same shared dict as its catalog entry), or None."""
+        return self._current_info_cache()[2].get(agent_id)
+
+    def _build_agents_info(self) -> Dict[str, Any]:
         agents_info = self.get_all_agents_info()
         all_capabilities: set[str] = set()
         for info in agents_info:
@@ -45,6 +81,7 @@ class AgentRegistry:
                 logger.debug("Pipeline agent %s already registered, skipping", name)
                 continue
             self._descriptors[name] = desc
+            self._version += 1
             logger.info("Registered pipeline agent: %s", name)
 
     def get_descriptor(self, agent_id: str) -> Optional[Any]:
@@ -53,6 +90,7 @@ class AgentRegistry:
 
     def reload(self) -> None:
         self._descriptors.clear()
+        self._version += 1
 
 
 # Global registry singleton
@@ -25,6 +25,7 @@ Skeleton-first mode (opt-in per agent):
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from dataclasses import dataclass, field
@@ -62,7 +63,10 @@ class MaterializeContext:
         task_id:           Current task identifier (same scope as Task Stack ``task_id``).
         input_bundle_v2:   Mutable deep copy of v2 generic inputs for materializer.
         persist_binary:    Callback that saves a ``MediaAsset`` to disk and
-                           returns the URI string of the saved file.
+                           returns the URI string of the saved file.  Called
+                           from worker threads, possibly concurrently for
+                           different assets, so it must not share mutable
+                           state across calls.
     """
 
     task_id: str
@@ -347,8 +351,13 @@ class BaseAgent(Generic[InputT, OutputT]):
                         asset_dict,
                         materialize_ctx.input_bundle_v2,
                     )
-                    for media in raw_media:
-                        uri = materialize_ctx.persist_binary(media)
+                    # Disk writes are blocking; overlap them in worker
+                    # threads instead of persisting one asset at a time.
+                    uris = await asyncio.gather(*(
+                        asyncio.to_thread(materialize_ctx.persist_binary, media)
+                        for media in raw_media
+                    ))
+                    for media, uri in zip(raw_media, uris):
                         media.uri_holder["uri"] = uri
                     media_assets = list(raw_media)
                 except Exception as exc:
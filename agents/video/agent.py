@@ -18,6 +18,9 @@ Wan2.6 supports audio-visual sync.
 
 from __future__ import annotations
 
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
 from typing import Any
 
 from ..base_agent import BaseAgent
@@ -32,6 +35,21 @@ from .schema import (
     VideoScene,
 )
 
+_actual_duration = attrgetter("actual_duration_sec")
+
+# Shared read-only defaults for .get() misses on screenplay dicts.
+_EMPTY_DICT: Any = MappingProxyType({})
+_EMPTY_TUPLE: tuple = ()
+
+
+@lru_cache(maxsize=32)
+def _parse_resolution(resolution: str) -> tuple[int, int]:
+    """Parse ``"WxH"`` into ``(width, height)``; default 1024x576."""
+    parts = resolution.split("x")
+    if len(parts) == 2:
+        return int(parts[0]), int(parts[1])
+    return 1024, 576
+
 
 class VideoAgent(BaseAgent[VideoAgentInput, VideoAgentOutput]):
 
@@ -51,83 +69,79 @@ class VideoAgent(BaseAgent[VideoAgentInput, VideoAgentOutput]):
         VideoAgent's output has zero creative fields — everything (scene IDs,
         shot segments, durations, transitions, asset placeholders) is derived
         from the screenplay.  No LLM call is needed.
+
+        Models are built with ``model_construct`` (no per-field validation):
+        every value is either produced here or coerced from the screenplay
+        explicitly, and ``recompute_metrics`` / ``VideoEvaluator`` still
+        check the result downstream.
         """
         sp = input_data.screenplay
-        sp_content = sp.get("content", {})
-        sp_scenes = sp_content.get("scenes", [])
+        sp_content = sp.get("content", _EMPTY_DICT)
+        sp_scenes = sp_content.get("scenes", _EMPTY_TUPLE)
 
         if not sp_scenes:
             return None  # fall back to legacy mode
 
         fps = input_data.constraints.fps
-        parts = input_data.constraints.output_resolution.split("x")
-        width = int(parts[0]) if len(parts) == 2 else 1024
-        height = int(parts[1]) if len(parts) == 2 else 576
+        width, height = _parse_resolution(input_data.constraints.output_resolution)
         transition_policy = input_data.constraints.transition_policy
+        # The policy is fixed for the whole call; resolve it once.
+        tr_type, tr_dur = (
+            ("dissolve", 0.5) if transition_policy == "soft" else ("cut", 0.0)
+        )
 
         scenes: list[VideoScene] = []
         total_duration = 0.0
 
         for scene_order, sp_scene in enumerate(sp_scenes, 1):
-            scene_id = sp_scene.get("scene_id", f"sc_{scene_order:03d}")
-            sp_shots = sp_scene.get("shots", [])
-
-            # --- Shot segments ---
-            segments: list[ShotSegment] = []
-            for shot_order, sp_shot in enumerate(sp_shots, 1):
-                shot_id = sp_shot.get("shot_id", "")
-                duration = sp_shot.get("estimated_duration_sec", 3.0)
-                segments.append(
-                    ShotSegment(
-                        shot_id=shot_id,
-                        order=shot_order,
-                        estimated_duration_sec=duration,
-                        actual_duration_sec=duration,
-                        video_asset=VideoAsset(
-                            asset_id=f"vid_{shot_id}",
-                            uri="placeholder",
-                            width=width,
-                            height=height,
-                            format="mp4",
-                            duration_sec=duration,
-                            fps=fps,
-                        ),
-                    )
+            scene_id = sp_scene.get("scene_id")
+            scene_id = "sc_%03d" % scene_order if scene_id is None else str(scene_id)
+            sp_shots = sp_scene.get("shots", _EMPTY_TUPLE)
+
+            # --- Shot segments (pre-sized via comprehension) ---
+            segments: list[ShotSegment] = [
+                ShotSegment.model_construct(
+                    shot_id=(shot_id := str(sp_shot.get("shot_id", ""))),
+                    order=shot_order,
+                    estimated_duration_sec=(
+                        duration := float(sp_shot.get("estimated_duration_sec", 3.0))
+                    ),
+                    actual_duration_sec=duration,
+                    video_asset=VideoAsset.model_construct(
+                        asset_id="vid_" + shot_id,
+                        uri="placeholder",
+                        width=width,
+                        height=height,
+                        format="mp4",
+                        duration_sec=duration,
+                        fps=fps,
+                    ),
+                    video_generation_prompt="",
+                    video_generation_constraints_json="",
                 )
+                for shot_order, sp_shot in enumerate(sp_shots, 1)
+            ]
 
             # --- Transition plan (between consecutive shots) ---
-            transitions: list[TransitionPlan] = []
-            for i in range(len(segments) - 1):
-                from_id = segments[i].shot_id
-                to_id = segments[i + 1].shot_id
-                if transition_policy == "soft":
-                    transitions.append(
-                        TransitionPlan(
-                            from_shot_id=from_id,
-                            to_shot_id=to_id,
-                            transition_type="dissolve",
-                            duration_sec=0.5,
-                        )
-                    )
-                else:
-                    transitions.append(
-                        TransitionPlan(
-                            from_shot_id=from_id,
-                            to_shot_id=to_id,
-                            transition_type="cut",
-                            duration_sec=0.0,
-                        )
-                    )
-
-            scene_dur = sum(seg.actual_duration_sec for seg in segments)
+            transitions: list[TransitionPlan] = [
+                TransitionPlan.model_construct(
+                    from_shot_id=prev.shot_id,
+                    to_shot_id=nxt.shot_id,
+                    transition_type=tr_type,
+                    duration_sec=tr_dur,
+                )
+                for prev, nxt in zip(segments, segments[1:])
+            ]
+
+            scene_dur = sum(map(_actual_duration, segments), 0.0)
             scenes.append(
-                VideoScene(
+                VideoScene.model_construct(
                     scene_id=scene_id,
                     order=scene_order,
                     shot_segments=segments,
                     transition_plan=transitions,
-                    scene_clip_asset=SceneClipAsset(
-                        asset_id=f"clip_{scene_id}",
+                    scene_clip_asset=SceneClipAsset.model_construct(
+                        asset_id="clip_" + scene_id,
                         uri="placeholder",
                         scene_duration_sec=scene_dur,
                         format="mp4",
@@ -136,20 +150,20 @@ class VideoAgent(BaseAgent[VideoAgentInput, VideoAgentOutput]):
             )
             total_duration += scene_dur
 
-        output = VideoAgentOutput()
-        output.content = VideoContent(
-            scenes=scenes,
-            final_video_asset=VideoAsset(
-                asset_id="final_video",
-                uri="placeholder",
-                width=width,
-                height=height,
-                format="mp4",
-                duration_sec=total_duration,
-                fps=fps,
+        return VideoAgentOutput.model_construct(
+            content=VideoContent.model_construct(
+                scenes=scenes,
+                final_video_asset=VideoAsset.model_construct(
+                    asset_id="final_video",
+                    uri="placeholder",
+                    width=width,
+                    height=height,
+                    format="mp4",
+                    duration_sec=total_duration,
+                    fps=fps,
+                ),
             ),
         )
-        return output
 
     # ------------------------------------------------------------------
     # Metrics & validation
@@ -160,19 +174,17 @@ class VideoAgent(BaseAgent[VideoAgentInput, VideoAgentOutput]):
         self._normalize_order(c.scenes)
         for scene in c.scenes:
             self._normalize_order(scene.shot_segments)
-        scene_count = len(c.scenes)
-        shot_count = sum(len(s.shot_segments) for s in c.scenes)
-        total_dur = sum(
-            seg.actual_duration_sec
-            for s in c.scenes
-            for seg in s.shot_segments
-        )
-        output.metrics.scene_count = scene_count
-        output.metrics.shot_segment_count = shot_count
-        output.metrics.total_duration_sec = total_dur
-        output.metrics.avg_shot_duration_sec = (
-            total_dur / shot_count if shot_count else 0.0
-        )
+        shot_count = 0
+        total_dur = 0.0
+        for s in c.scenes:
+            segs = s.shot_segments
+            shot_count += len(segs)
+            total_dur += sum(map(_actual_duration, segs))
+        m = output.metrics
+        m.scene_count = len(c.scenes)
+        m.shot_segment_count = shot_count
+        m.total_duration_sec = total_dur
+        m.avg_shot_duration_sec = total_dur / shot_count if shot_count else 0.0
 
     # Quality evaluation has been moved to VideoEvaluator
     # (see evaluator.py in this package).
@@ -421,6 +421,8 @@ class VideoMaterializer(BaseMaterializer):
         for scene in content.get("scenes", []):
             scene_id = scene.get("scene_id", "")
             clip_bytes_list: list[bytes] = []
+            clip_requests: list[dict[str, Any]] = []
+            clip_targets: list[tuple[str, str, dict[str, Any]]] = []
 
             for seg in scene.get("shot_segments", []):
                 shot_id = seg.get("shot_id", "")
@@ -467,22 +469,37 @@ class VideoMaterializer(BaseMaterializer):
                     else ""
                 )
 
-                try:
-                    clip_bytes = await self.video_svc.generate_clip(
-                        shot_id=shot_id,
-                        keyframe_images=keyframe_images,
-                        prompt=clip_prompt,
-                        duration_sec=seg.get("estimated_duration_sec", 3.0),
-                        consistency_constraints=structured_constraints,
+                clip_requests.append({
+                    "shot_id": shot_id,
+                    "keyframe_images": keyframe_images,
+                    "prompt": clip_prompt,
+                    "duration_sec": seg.get("estimated_duration_sec", 3.0),
+                    "consistency_constraints": structured_constraints,
+                })
+                clip_targets.append((shot_id, sys_vid_id, video_asset))
+
+            # One batch per scene so the backend can generate clips together.
+            clip_results = (
+                await self.video_svc.generate_clips_batch(clip_requests)
+                if clip_requests
+                else []
+            )
+            for (shot_id, sys_vid_id, video_asset), clip_bytes in zip(
+                clip_targets, clip_results
+            ):
+                if isinstance(clip_bytes, BaseException):
+                    if not isinstance(clip_bytes, Exception):
+                        raise clip_bytes
+                    logger.error(
+                        "Video clip generation failed for %s: %s", shot_id, clip_bytes
                     )
-                    ext = video_asset.get("format", "mp4")
-                    pending.append(MediaAsset(
-                        sys_id=sys_vid_id, data=clip_bytes,
-                        extension=ext, uri_holder=video_asset,
-                    ))
-                    clip_bytes_list.append(clip_bytes)
-                except Exception as exc:
-                    logger.error("Video clip generation failed for %s: %s", shot_id, exc)
+                    continue
+                ext = video_asset.get("format", "mp4")
+                pending.append(MediaAsset(
+                    sys_id=sys_vid_id, data=clip_bytes,
+                    extension=ext, uri_holder=video_asset,
+                ))
+                clip_bytes_list.append(clip_bytes)
 
             scene_clip = scene.get("scene_clip_asset", {})
             sys_scene_clip_id = f"clip_{scene_id}"
@@ -10,6 +10,7 @@ _project_root = str(Path(__file__).resolve().parent.parent.parent)
 if _project_root not in sys.path:
     sys.path.insert(0, _project_root)
 
+from .common_http import OrjsonProvider, gzip_json_response
 from .task_stack import create_blueprint
 from .assistant import create_assistant_blueprint
 
@@ -17,9 +18,14 @@ from .assistant import create_assistant_blueprint
 def create_app(config=None):
     """Create and configure the Flask application"""
     app = Flask(__name__)
+    # jsonify / JSON request bodies go through orjson
+    app.json = OrjsonProvider(app)
     
     # Enable CORS for frontend integration
     CORS(app)
+
+    # Large JSON listings are gzip-compressed for clients that accept it
+    app.after_request(gzip_json_response)
     
     # Load configuration if provided
     if config:
@@ -18,7 +18,7 @@ class ExecutionStatus(Enum):
     FAILED = "FAILED"
 
 
-@dataclass
+@dataclass(slots=True)
 class Assistant:
     """
     Global Assistant instance that manages all sub-agents
@@ -34,7 +34,7 @@ class Assistant:
     updated_at: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentExecution:
     """Tracks an agent execution instance"""
     id: str
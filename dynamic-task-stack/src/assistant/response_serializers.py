@@ -9,61 +9,160 @@ from __future__ import annotations
 from dataclasses import fields, is_dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from operator import attrgetter
+from typing import Any, Callable
 
+import orjson
+
+from .models import AgentExecution, Assistant, ExecutionStatus
 from .workspace.models import FileMetadata, LogEntry
 
 
+def _dataclass_serializer(cls: type) -> Callable[[Any], dict[str, Any]]:
+    # Field names are read from the class once; each call only walks values.
+    names = tuple(field.name for field in fields(cls))
+
+    def serialize(obj: Any) -> dict[str, Any]:
+        return {name: serialize_response_value(getattr(obj, name)) for name in names}
+
+    return serialize
+
+
+def _serialize_binary(obj: bytes | bytearray) -> dict[str, Any]:
+    # Never return raw binary payloads in JSON responses.
+    return {
+        "_type": "binary",
+        "size_bytes": len(obj),
+    }
+
+
+def _serialize_list(obj: list) -> list:
+    return [serialize_response_value(item) for item in obj]
+
+
+def _serialize_dict(obj: dict) -> dict:
+    return {k: serialize_response_value(v) for k, v in obj.items()}
+
+
+def _passthrough(obj: Any) -> Any:
+    return obj
+
+
+# ``Enum.value`` is a Python-level property; ``_value_`` is the plain instance
+# attribute behind it (set on every member, including Flag pseudo-members).
+_enum_value = attrgetter("_value_")
+
+
+def _resolve_serializer(cls: type) -> Callable[[Any], Any]:
+    # Same precedence as the original isinstance chain (Enum before int, ...).
+    if issubclass(cls, Enum):
+        return _enum_value
+    if issubclass(cls, datetime):
+        return cls.isoformat
+    if is_dataclass(cls):
+        return _dataclass_serializer(cls)
+    if issubclass(cls, (bytes, bytearray)):
+        return _serialize_binary
+    if issubclass(cls, list):
+        return _serialize_list
+    if issubclass(cls, dict):
+        return _serialize_dict
+    return _passthrough
+
+
+# Exact type -> handler; other types (enums, dataclasses, subclasses) are
+# resolved once and added on first use.
+_SERIALIZERS: dict[type, Callable[[Any], Any]] = {
+    str: _passthrough,
+    int: _passthrough,
+    float: _passthrough,
+    bool: _passthrough,
+    type(None): _passthrough,
+    list: _serialize_list,
+    dict: _serialize_dict,
+    datetime: datetime.isoformat,
+    bytes: _serialize_binary,
+    bytearray: _serialize_binary,
+}
+# Response models get their field plans at import instead of on first request.
+for _model in (Assistant, AgentExecution):
+    _SERIALIZERS[_model] = _dataclass_serializer(_model)
+_SERIALIZERS[ExecutionStatus] = _enum_value
+del _model
+
+
 def serialize_response_value(obj: Any) -> Any:
     """Serialize dataclasses/enums into JSON-compatible values."""
-    if isinstance(obj, Enum):
-        return obj.value
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    if is_dataclass(obj):
-        return {
-            field.name: serialize_response_value(getattr(obj, field.name))
-            for field in fields(obj)
-        }
+    cls = type(obj)
+    handler = _SERIALIZERS.get(cls)
+    if handler is None:
+        handler = _SERIALIZERS[cls] = _resolve_serializer(cls)
+    return handler(obj)
+
+
+def _binary_placeholder_default(obj: Any) -> Any:
     if isinstance(obj, (bytes, bytearray)):
-        # Never return raw binary payloads in JSON responses.
         return {
             "_type": "binary",
             "size_bytes": len(obj),
         }
-    if isinstance(obj, list):
-        return [serialize_response_value(item) for item in obj]
-    if isinstance(obj, dict):
-        return {k: serialize_response_value(v) for k, v in obj.items()}
-    return obj
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
 
 
-def _file_core_fields(file_meta: FileMetadata) -> dict[str, Any]:
-    return {
-        "id": file_meta.id,
-        "filename": file_meta.filename,
-        "description": file_meta.description,
-        "file_type": file_meta.file_type,
-        "file_path": file_meta.file_path,
-    }
+def dumps_response_value(obj: Any, *, sort_keys: bool = False) -> bytes:
+    """``serialize_response_value`` + JSON encode in one orjson pass (UTF-8 bytes).
+
+    orjson walks dataclasses, dicts and lists in C and writes enums as
+    ``.value`` and datetimes as ISO 8601 itself; only binary payloads reach
+    the Python ``default`` hook. Dataclass fields starting with ``_`` are
+    omitted (the assistant models have none).
+    """
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, default=_binary_placeholder_default, option=option)
+
+
+_FILE_FIELDS = attrgetter(
+    "id",
+    "filename",
+    "description",
+    "file_type",
+    "file_path",
+    "file_extension",
+    "size_bytes",
+    "created_at_iso",
+    "created_by",
+    "tags",
+    "metadata",
+)
 
 
 def file_metadata_to_dict(file_meta: FileMetadata) -> dict[str, Any]:
+    # One attrgetter call and one dict literal per row (routes list every file).
+    (
+        file_id, filename, description, file_type, file_path, file_extension,
+        size_bytes, created_at_iso, created_by, tags, metadata,
+    ) = _FILE_FIELDS(file_meta)
     return {
-        **_file_core_fields(file_meta),
-        "file_extension": file_meta.file_extension,
-        "size_bytes": file_meta.size_bytes,
-        "created_at": file_meta.created_at.isoformat(),
-        "created_by": file_meta.created_by,
-        "tags": file_meta.tags,
-        "metadata": file_meta.metadata,
+        "id": file_id,
+        "filename": filename,
+        "description": description,
+        "file_type": file_type,
+        "file_path": file_path,
+        "file_extension": file_extension,
+        "size_bytes": size_bytes,
+        "created_at": created_at_iso,
+        "created_by": created_by,
+        "tags": tags,
+        "metadata": metadata,
     }
 
 
 def log_entry_to_dict(log: LogEntry) -> dict[str, Any]:
     return {
         "id": log.id,
-        "timestamp": log.timestamp.isoformat(),
+        "timestamp": log.timestamp_iso,
         "operation_type": log.operation_type,
         "resource_type": log.resource_type,
         "resource_id": log.resource_id,
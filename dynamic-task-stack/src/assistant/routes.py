@@ -1,8 +1,10 @@
 # API routes for Assistant System
 
-from typing import Any, Dict, Optional, Tuple
+import hashlib
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify, stream_with_context
 
 from ..common_http import bad_request, json_body_or_error
 from .service import (
@@ -11,11 +13,7 @@ from .service import (
     AssistantGlobalMemorySyncError,
 )
 from .state_store import assistant_state_store
-from .response_serializers import (
-    serialize_response_value,
-    file_metadata_to_dict,
-    log_entry_to_dict,
-)
+from .response_serializers import dumps_response_value
 from agents import get_agent_registry
 
 
@@ -42,6 +40,130 @@ def _execute_error_response(
     return jsonify({"error": message, "error_reasoning": error_reasoning}), status
 
 
+_STREAM_BATCH_SIZE = 256
+
+
+def _json_array_response(items: Iterable[Any]):
+    """Stream a JSON array of dataclass rows, encoding them in batches as the body is sent.
+
+    Keeps peak memory at one encoded batch instead of the whole list plus its
+    blob. Each batch is one ``dumps_response_value`` call (orjson walks the
+    dataclasses in C; no per-row dict).
+    """
+    sort_keys = current_app.json.sort_keys
+
+    def generate() -> Iterator[bytes]:
+        it = iter(items)
+        sep = b"["
+        while batch := list(islice(it, _STREAM_BATCH_SIZE)):
+            # Splice the batch's elements in: drop its "[" and trailing "]\n".
+            yield sep + dumps_response_value(batch, sort_keys=sort_keys)[1:-2]
+            sep = b","
+        yield b"[]\n" if sep == b"[" else b"]\n"
+
+    return current_app.response_class(
+        stream_with_context(generate()),
+        mimetype=current_app.json.mimetype,
+    )
+
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+def _ndjson_response(items: Iterable[Any]):
+    """Stream dataclass rows as NDJSON (one JSON object per line) for ``?stream=ndjson``.
+
+    Clients can parse each line as it arrives; batches are encoded with
+    ``dumps_response_value`` like the JSON-array stream.
+    """
+    sort_keys = current_app.json.sort_keys
+
+    def generate() -> Iterator[bytes]:
+        it = iter(items)
+        while batch := list(islice(it, _STREAM_BATCH_SIZE)):
+            yield b"".join(dumps_response_value(item, sort_keys=sort_keys) for item in batch)
+
+    return current_app.response_class(
+        stream_with_context(generate()),
+        mimetype=NDJSON_MIMETYPE,
+    )
+
+
+def _response_value_json(obj: Any, status: int = 200):
+    """``jsonify(serialize_response_value(obj))`` without the Python-level walk."""
+    provider = current_app.json
+    return current_app.response_class(
+        dumps_response_value(obj, sort_keys=provider.sort_keys),
+        status=status,
+        mimetype=provider.mimetype,
+    )
+
+
+def _etag_for(data: bytes) -> str:
+    """Opaque validator for a body or a state key (stable across processes)."""
+    return hashlib.blake2b(data, digest_size=12).hexdigest()
+
+
+def _conditional_response(etag: str, build_response: Callable[[], Any]):
+    """Weak-ETag GET: ``304`` when ``If-None-Match`` matches, else the built response.
+
+    Tags are weak because the gzip hook may re-encode the same JSON body.
+    """
+    if request.if_none_match.contains_weak(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = build_response()
+    response.set_etag(etag, weak=True)
+    return response
+
+
+def _tagged_response_value_json(obj: Any):
+    """``_response_value_json`` with an ETag of the encoded body (``304`` when unchanged).
+
+    For single-resource polls (assistant, execution status, file metadata):
+    the body is still encoded, but unchanged state is not re-sent.
+    """
+    provider = current_app.json
+    body = dumps_response_value(obj, sort_keys=provider.sort_keys)
+    return _conditional_response(
+        _etag_for(body),
+        lambda: current_app.response_class(body, mimetype=provider.mimetype),
+    )
+
+
+def _execute_request_or_error():
+    """Parse ``agent_id``, ``task_id``, ``execute_fields`` shared by both execute routes."""
+    data, error = json_body_or_error()
+    if error:
+        return None, error
+
+    agent_id = data.get('agent_id')
+    task_id = data.get('task_id')
+    try:
+        execute_fields = _execute_fields_from_http_body(data)
+    except ValueError as e:
+        return None, _execute_error_response(str(e), 400)
+
+    if not agent_id or not task_id:
+        return None, _execute_error_response(
+            "Missing required fields: agent_id, task_id", 400
+        )
+    return (agent_id, task_id, execute_fields), None
+
+
+def _get_workspace_or_404():
+    workspace = assistant_state_store.get_global_workspace()
+    if workspace is None:
+        return None, (jsonify({'error': 'Workspace not found'}), 404)
+    return workspace, None
+
+
+def _memory_etag(workspace, route: str, *query: Any) -> str:
+    """Tag a memory read by workspace, memory version and the resolved query."""
+    key = (route, workspace.id, workspace.memory_version(), *query)
+    return _etag_for(repr(key).encode())
+
+
 def create_assistant_blueprint():
     """Create and configure the Flask blueprint for assistant system"""
     bp = Blueprint('assistant', __name__)
@@ -49,12 +171,35 @@ def create_assistant_blueprint():
     # Initialize assistant service
     service = AssistantService(assistant_state_store)
 
-    def _get_workspace_or_404():
-        workspace = assistant_state_store.get_global_workspace()
-        if workspace is None:
-            return None, (jsonify({'error': 'Workspace not found'}), 404)
-        return workspace, None
-    
+    # The registry is a process-wide singleton (reload() mutates it in place),
+    # so resolve it once instead of per request.
+    registry = get_agent_registry()
+
+    # Encoded bodies for registry-derived GETs:
+    # key -> (registry version, bytes, etag of bytes).
+    _registry_body_cache: Dict[str, Tuple[Optional[int], bytes, str]] = {}
+
+    def _registry_json_response(key: str, build: Callable[[], Any]):
+        """``jsonify(build())``, reusing the encoded body while the registry version holds.
+
+        Bodies carry an ETag of their bytes (``304`` on a matching
+        ``If-None-Match``). Registries without a ``version`` are encoded on
+        every call and never cached.
+        """
+        version = getattr(registry, "version", None)
+        cached = _registry_body_cache.get(key) if isinstance(version, int) else None
+        if cached is None or cached[0] != version:
+            body = current_app.json.response(build()).get_data()
+            cached = (version, body, _etag_for(body))
+            if isinstance(version, int):
+                _registry_body_cache[key] = cached
+        return _conditional_response(
+            cached[2],
+            lambda: current_app.response_class(
+                cached[1], mimetype=current_app.json.mimetype
+            ),
+        )
+
     # Global Assistant routes (singleton, pre-defined)
     @bp.route('/api/assistant', methods=['GET'])
     def get_assistant():
@@ -65,7 +210,7 @@ def create_assistant_blueprint():
         All sub-agents are automatically discovered from the registry.
         """
         assistant = assistant_state_store.get_global_assistant()
-        return jsonify(serialize_response_value(assistant))
+        return _tagged_response_value_json(assistant)
     
     # Sub-Agent routes (from registry)
     @bp.route('/api/assistant/sub-agents', methods=['GET'])
@@ -75,19 +220,15 @@ def create_assistant_blueprint():
         
         Returns aggregated information about all available sub-agents
         """
-        registry = get_agent_registry()
-        agents_info = registry.gather_agents_info()
-        return jsonify(agents_info)
+        return _registry_json_response("*", registry.gather_agents_info)
     
     @bp.route('/api/assistant/sub-agents/<agent_id>', methods=['GET'])
     def get_sub_agent(agent_id: str):
         """Get information about a specific sub-agent"""
-        registry = get_agent_registry()
-        agents_info = registry.gather_agents_info().get("agents", [])
-        agent = next((item for item in agents_info if item.get("id") == agent_id), None)
+        agent = registry.get_agent_info(agent_id)
         if agent is None:
             return jsonify({'error': 'Sub-agent not found'}), 404
-        return jsonify(agent)
+        return _registry_json_response(f"agent:{agent_id}", lambda: agent)
     
     # Execution routes
     @bp.route('/api/assistant/execute', methods=['POST'])
@@ -105,21 +246,10 @@ def create_assistant_blueprint():
 
         Error body (4xx/5xx on this route): ``error``, ``error_reasoning`` (placeholder, often ``null``).
         """
-        data, error = json_body_or_error()
+        request_fields, error = _execute_request_or_error()
         if error:
             return error
-        
-        agent_id = data.get('agent_id')
-        task_id = data.get('task_id')
-        try:
-            execute_fields = _execute_fields_from_http_body(data)
-        except ValueError as e:
-            return _execute_error_response(str(e), 400)
-
-        if not agent_id or not task_id:
-            return _execute_error_response(
-                "Missing required fields: agent_id, task_id", 400
-            )
+        agent_id, task_id, execute_fields = request_fields
 
         try:
             results = service.execute_agent_for_task(
@@ -127,7 +257,7 @@ def create_assistant_blueprint():
                 task_id=task_id,
                 execute_fields=execute_fields
             )
-            return jsonify(serialize_response_value(results)), 200
+            return _response_value_json(results)
         except AssistantBadExecuteFieldsError as e:
             return _execute_error_response(str(e), 400)
         except AssistantGlobalMemorySyncError as e:
@@ -137,22 +267,61 @@ def create_assistant_blueprint():
         except Exception as e:
             return _execute_error_response(f"Execution failed: {str(e)}", 500)
     
+    @bp.route('/api/assistant/execute/call-async', methods=['POST'])
+    def execute_agent_async():
+        """
+        Queue an agent execution and return immediately.
+
+        Same JSON body as ``POST /api/assistant/execute``. Responds ``202`` with
+        ``task_id``, ``execution_id``, ``status`` (``PENDING``); poll
+        ``GET /api/assistant/executions/<execution_id>`` until ``COMPLETED`` /
+        ``FAILED``. Unknown agents are rejected up front with ``404``.
+        """
+        request_fields, error = _execute_request_or_error()
+        if error:
+            return error
+        agent_id, task_id, execute_fields = request_fields
+
+        try:
+            execution = service.submit_agent_for_task(
+                agent_id=agent_id,
+                task_id=task_id,
+                execute_fields=execute_fields,
+            )
+        except ValueError as e:
+            return _execute_error_response(str(e), 404)
+        return jsonify({
+            "task_id": execution.task_id,
+            "execution_id": execution.id,
+            "status": execution.status.value,
+        }), 202
+
+    @bp.route('/api/assistant/executions/<execution_id>', methods=['GET'])
+    def get_execution(execution_id: str):
+        """Get one execution (polling target for ``/execute/call-async``)"""
+        execution = assistant_state_store.get_execution(execution_id)
+        if execution is None:
+            return jsonify({'error': 'Execution not found'}), 404
+        return _tagged_response_value_json(execution)
+
     @bp.route('/api/assistant/executions/task/<task_id>', methods=['GET'])
     def get_executions_by_task(task_id: str):
         """Get all executions for a task"""
         executions = assistant_state_store.get_executions_by_task(task_id)
-        return jsonify([serialize_response_value(e) for e in executions])
+        return _response_value_json(executions)
     
     # Workspace routes
     @bp.route('/api/assistant/workspace/files', methods=['GET'])
     def list_workspace_files():
-        """List files in workspace"""
+        """List files in workspace (``?stream=ndjson`` for one object per line)"""
         workspace, error = _get_workspace_or_404()
         if error:
             return error
         files = workspace.list_files()
-        
-        return jsonify([file_metadata_to_dict(f) for f in files])
+
+        if request.args.get('stream') == 'ndjson':
+            return _ndjson_response(files)
+        return _response_value_json(files)
     
     @bp.route('/api/assistant/workspace/files/<file_id>', methods=['GET'])
     def get_workspace_file(file_id: str):
@@ -165,7 +334,7 @@ def create_assistant_blueprint():
         if file_meta is None:
             return jsonify({'error': 'File not found'}), 404
         
-        return jsonify(file_metadata_to_dict(file_meta))
+        return _tagged_response_value_json(file_meta)
     
     @bp.route('/api/assistant/workspace/memory/entries', methods=['GET'])
     def list_workspace_memory_entries():
@@ -174,18 +343,21 @@ def create_assistant_blueprint():
         if error:
             return error
 
-        task_id = request.args.get('task_id')
-        agent_id = request.args.get('agent_id')
-        limit = request.args.get('limit', type=int, default=20)
+        args = request.args
+        task_id = args.get('task_id')
+        agent_id = args.get('agent_id')
+        limit = args.get('limit', type=int, default=20)
         if limit <= 0:
             return bad_request('limit must be a positive integer')
 
-        entries = workspace.list_memory_entries(
-            task_id=task_id,
-            agent_id=agent_id,
-            limit=limit,
+        return _conditional_response(
+            _memory_etag(workspace, "entries", task_id, agent_id, limit),
+            lambda: jsonify(workspace.list_memory_entries(
+                task_id=task_id,
+                agent_id=agent_id,
+                limit=limit,
+            )),
         )
-        return jsonify(entries)
 
     @bp.route('/api/assistant/workspace/memory/entries', methods=['POST'])
     def add_workspace_memory_entry():
@@ -224,9 +396,10 @@ def create_assistant_blueprint():
         if error:
             return error
 
-        task_id = request.args.get('task_id')
-        agent_id = request.args.get('agent_id')
-        limit_raw = request.args.get('limit', type=int)
+        args = request.args
+        task_id = args.get('task_id')
+        agent_id = args.get('agent_id')
+        limit_raw = args.get('limit', type=int)
         limit: Optional[int]
         if limit_raw is None:
             limit = None
@@ -235,25 +408,29 @@ def create_assistant_blueprint():
         else:
             limit = limit_raw
 
-        brief = workspace.get_memory_brief(
-            task_id=task_id,
-            agent_id=agent_id,
-            limit=limit,
+        return _conditional_response(
+            _memory_etag(workspace, "brief", task_id, agent_id, limit),
+            lambda: jsonify(workspace.get_memory_brief(
+                task_id=task_id,
+                agent_id=agent_id,
+                limit=limit,
+            )),
         )
-        return jsonify(brief)
     
     @bp.route('/api/assistant/workspace/logs', methods=['GET'])
     def get_workspace_logs():
-        """Get logs from workspace"""
+        """Get logs from workspace (``?stream=ndjson`` for one object per line)"""
         workspace, error = _get_workspace_or_404()
         if error:
             return error
         
-        operation_type = request.args.get('operation_type')
-        resource_type = request.args.get('resource_type')
-        agent_id = request.args.get('agent_id')
-        task_id = request.args.get('task_id')
-        limit = request.args.get('limit', type=int)
+        # Resolve the request proxy once for all query parameters.
+        args = request.args
+        operation_type = args.get('operation_type')
+        resource_type = args.get('resource_type')
+        agent_id = args.get('agent_id')
+        task_id = args.get('task_id')
+        limit = args.get('limit', type=int)
         
         logs = workspace.get_logs(
             operation_type=operation_type,
@@ -262,7 +439,13 @@ def create_assistant_blueprint():
             task_id=task_id,
             limit=limit
         )
-        
-        return jsonify([log_entry_to_dict(log) for log in logs])
+
+        if args.get('stream') == 'ndjson':
+            return _ndjson_response(logs)
+        # Limited pages that fit in one batch (the UI asks for ``limit=20``)
+        # go out as one body so the gzip hook still applies; stream the rest.
+        if limit and len(logs) <= _STREAM_BATCH_SIZE:
+            return _response_value_json(logs)
+        return _json_array_response(logs)
 
     return bp
@@ -1,12 +1,15 @@
 # Assistant Service - Core business logic for agent orchestration
 
 import asyncio
+import atexit
 import hashlib
 import json
 import logging
 import os
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 from pathlib import Path
@@ -55,6 +58,11 @@ def _global_memory_context_entries_limit() -> int:
     return _env_int("ASSISTANT_GLOBAL_MEMORY_CONTEXT_ENTRIES_MAX", 20, lo=1, hi=500)
 
 
+def _background_execute_workers() -> int:
+    """Worker threads for ``POST /api/assistant/execute/call-async`` (default 2)."""
+    return _env_int("ASSISTANT_BACKGROUND_EXECUTE_WORKERS", 2, lo=1, hi=32)
+
+
 class AssistantBadExecuteFieldsError(Exception):
     """``execute_fields`` violated a strict wire rule (e.g. ``text`` must be a string)."""
 
@@ -96,6 +104,9 @@ class AssistantService:
         ).strip()
         # Get or create the global workspace
         self.workspace = self._get_global_workspace()
+        # Lazily started pool for submit_agent_for_task (sync callers never pay for it).
+        self._background_executor: Optional[ThreadPoolExecutor] = None
+        self._background_executor_lock = Lock()
 
     def _get_global_workspace(self) -> Workspace:
         """
@@ -127,7 +138,9 @@ class AssistantService:
         except (TypeError, ValueError):
             return str(value)[:max_chars]
         if len(raw) <= max_chars:
-            return json.loads(raw) if raw.startswith("{") or raw.startswith("[") else raw
+            # Objects/arrays are embedded as-is; the prompt re-encodes them, so
+            # decoding ``raw`` again would only rebuild an equal structure.
+            return value if raw.startswith(("{", "[")) else raw
         return raw[:max_chars] + "\n…(truncated)"
 
     @staticmethod
@@ -637,18 +650,8 @@ class AssistantService:
         }
 
     def _has_existing_assets(self, *, task_id: str, agent_id: str) -> bool:
-        files = self.workspace.list_files()
-        if not files:
-            return False
-        for file_item in files:
-            metadata = file_item.metadata if hasattr(file_item, "metadata") else {}
-            if not isinstance(metadata, dict):
-                continue
-            if metadata.get("task_id") != task_id:
-                continue
-            if metadata.get("producer_agent_id") != agent_id:
-                continue
-            if metadata.get("asset_key"):
+        for file_item in self.workspace.list_files_by_producer(task_id, agent_id):
+            if file_item.metadata.get("asset_key"):
                 return True
         return False
     
@@ -657,6 +660,7 @@ class AssistantService:
         agent_id: str,
         task_id: str,
         inputs: Dict[str, Any],
+        execution: Optional[AgentExecution] = None,
     ) -> AgentExecution:
         """
         Execute an agent and retrieve results
@@ -665,6 +669,8 @@ class AssistantService:
             agent_id: ID of the agent to execute
             task_id: ID of the task
             inputs: Input data for the agent
+            execution: Pre-created ``PENDING`` record (background submissions);
+                a new record is created when omitted
             
         Returns:
             AgentExecution instance with results
@@ -680,11 +686,14 @@ class AssistantService:
             raise ValueError(f"Agent {agent_id} not found in registry")
         
         # Create execution record
-        execution = self.storage.create_execution(
-            agent_id=agent_id,
-            task_id=task_id,
-            inputs=inputs
-        )
+        if execution is None:
+            execution = self.storage.create_execution(
+                agent_id=agent_id,
+                task_id=task_id,
+                inputs=inputs
+            )
+        else:
+            execution.inputs = inputs
         
         try:
             # Update execution status
@@ -1165,7 +1174,8 @@ class AssistantService:
         self,
         agent_id: str,
         task_id: str,
-        execute_fields: Optional[Dict[str, Any]] = None
+        execute_fields: Optional[Dict[str, Any]] = None,
+        execution: Optional[AgentExecution] = None,
     ) -> Dict[str, Any]:
         """
         Complete workflow: Execute an agent for a task.
@@ -1201,6 +1211,7 @@ class AssistantService:
             agent_id=agent_id,
             task_id=task_id,
             inputs=inputs,
+            execution=execution,
         )
         
         # 3) Persist results and return task-running summary payload
@@ -1209,3 +1220,74 @@ class AssistantService:
             workspace,
             overwrite_existing_assets=overwrite_existing_assets,
         )
+
+    def _get_background_executor(self) -> ThreadPoolExecutor:
+        with self._background_executor_lock:
+            if self._background_executor is None:
+                self._background_executor = ThreadPoolExecutor(
+                    max_workers=_background_execute_workers(),
+                    thread_name_prefix="assistant-execute",
+                )
+                atexit.register(self.shutdown_background_executor)
+            return self._background_executor
+
+    def shutdown_background_executor(self, wait: bool = True) -> None:
+        """Stop the background pool, cancelling queued runs that have not started.
+
+        Registered with :mod:`atexit` when the pool starts; the next
+        :meth:`submit_agent_for_task` starts a fresh pool.
+        """
+        with self._background_executor_lock:
+            executor, self._background_executor = self._background_executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def submit_agent_for_task(
+        self,
+        agent_id: str,
+        task_id: str,
+        execute_fields: Optional[Dict[str, Any]] = None,
+    ) -> AgentExecution:
+        """Queue :meth:`execute_agent_for_task` on a background thread.
+
+        The execution record is created (``PENDING``) before returning so the
+        caller can poll ``GET /api/assistant/executions/<execution_id>``.
+
+        Raises:
+            ValueError: If the agent is not an executable registry descriptor
+        """
+        self.storage.get_global_assistant()
+        descriptor = self.agent_registry.get_descriptor(agent_id)
+        if not self._is_executable_pipeline_descriptor(descriptor):
+            raise ValueError(f"Agent {agent_id} not found in registry")
+
+        execution = self.storage.create_execution(
+            agent_id=agent_id,
+            task_id=task_id,
+            inputs={},
+        )
+        self._get_background_executor().submit(
+            self._run_submitted_execution,
+            execution,
+            dict(execute_fields or {}),
+        )
+        return execution
+
+    def _run_submitted_execution(
+        self,
+        execution: AgentExecution,
+        execute_fields: Dict[str, Any],
+    ) -> None:
+        """Worker body for :meth:`submit_agent_for_task`; failures land on the record."""
+        try:
+            self.execute_agent_for_task(
+                agent_id=execution.agent_id,
+                task_id=execution.task_id,
+                execute_fields=execute_fields,
+                execution=execution,
+            )
+        except Exception as e:
+            logger.warning("background execution %s failed", execution.id, exc_info=True)
+            # Input building, the run or persisting its results raised: the
+            # record is FAILED even if the agent itself had completed.
+            self.storage.fail_execution(execution.id, str(e))
@@ -1,5 +1,6 @@
 """State store for Assistant runtime singletons and execution records."""
 
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 from threading import RLock
@@ -37,12 +38,20 @@ class AssistantStateStore:
 
         self.global_assistant: Optional[Assistant] = None
         self.executions: Dict[str, AgentExecution] = {}
+        # task_id -> execution ids in creation order (Director polls per task),
+        # plus the task_id each execution was indexed under.
+        self._execution_ids_by_task: Dict[str, List[str]] = {}
+        self._indexed_task_ids: Dict[str, str] = {}
         self.global_workspace: Optional[Workspace] = None
         self.execution_counter = 0
         self.lock = RLock()
 
     def get_global_assistant(self) -> Assistant:
         """Get or create the global assistant instance (singleton)."""
+        assistant = self.global_assistant
+        if assistant is not None:
+            # Set once and never replaced: skip the lock on the hot path.
+            return assistant
         with self.lock:
             if self.global_assistant is None:
                 self.global_assistant = Assistant(
@@ -84,15 +93,17 @@ class AssistantStateStore:
                 created_at=datetime.now(),
             )
             self.executions[execution_id] = execution
+            self._execution_ids_by_task.setdefault(task_id, []).append(execution_id)
+            self._indexed_task_ids[execution_id] = task_id
             return execution
 
     def get_executions_by_task(self, task_id: str) -> List[AgentExecution]:
         """Get all executions for a task."""
         with self.lock:
+            executions = self.executions
             return [
-                execution
-                for execution in self.executions.values()
-                if execution.task_id == task_id
+                executions[execution_id]
+                for execution_id in self._execution_ids_by_task.get(task_id, ())
             ]
 
     def get_execution(self, execution_id: str) -> Optional[AgentExecution]:
@@ -106,8 +117,46 @@ class AssistantStateStore:
             if execution.id not in self.executions:
                 return False
             self.executions[execution.id] = execution
+            indexed_task_id = self._indexed_task_ids.get(execution.id)
+            if indexed_task_id != execution.task_id:
+                self._indexed_task_ids[execution.id] = execution.task_id
+                if indexed_task_id is not None:
+                    self._reindex_task(indexed_task_id)
+                self._reindex_task(execution.task_id)
             return True
 
+    def fail_execution(self, execution_id: str, error: str) -> Optional[AgentExecution]:
+        """Mark an execution ``FAILED`` under the lock and return the stored record.
+
+        The record is swapped for an updated copy, so readers serializing the
+        previous object never see a half-written status. An ``error`` or
+        ``completed_at`` already on the record is kept.
+        """
+        with self.lock:
+            current = self.executions.get(execution_id)
+            if current is None:
+                return None
+            failed = replace(
+                current,
+                status=ExecutionStatus.FAILED,
+                error=current.error or error,
+                completed_at=current.completed_at or datetime.now(),
+            )
+            self.executions[execution_id] = failed
+            return failed
+
+    def _reindex_task(self, task_id: str) -> None:
+        """Rebuild one task's index entry (only needed if a task_id changes)."""
+        ids = [
+            execution_id
+            for execution_id, execution in self.executions.items()
+            if execution.task_id == task_id
+        ]
+        if ids:
+            self._execution_ids_by_task[task_id] = ids
+        else:
+            self._execution_ids_by_task.pop(task_id, None)
+
     def create_global_workspace(self) -> Workspace:
         """Create the global workspace shared by all agents."""
         with self.lock:
@@ -125,9 +174,12 @@ class AssistantStateStore:
             return workspace
 
     def get_global_workspace(self) -> Optional[Workspace]:
-        """Get the global workspace shared by all agents."""
-        with self.lock:
-            return self.global_workspace
+        """Get the global workspace shared by all agents.
+
+        Lock-free: the reference is assigned once (under the lock) by
+        ``create_global_workspace`` and a single attribute read is atomic.
+        """
+        return self.global_workspace
 
 
 # Preferred singleton name.
@@ -15,6 +15,9 @@ from .models import FileMetadata
 class AssetManager:
     """Manage asset persistence, indexing, and hydration inside a workspace."""
 
+    # Persist-plan kinds written in the first pass (before URI rewriting).
+    _IMMEDIATE_PLAN_KINDS = frozenset(("binary", "media"))
+
     def __init__(
         self,
         store_file_at_relative_path: Callable[..., FileMetadata],
@@ -23,6 +26,8 @@ class AssetManager:
         list_files: Callable[..., List[FileMetadata]],
         delete_file: Callable[[str], bool],
         *,
+        delete_files: Optional[Callable[[List[str]], List[FileMetadata]]] = None,
+        list_files_by_producer: Optional[Callable[[str, str], List[FileMetadata]]] = None,
         on_change: Optional[Callable[[], None]] = None,
     ):
         self._store_file_at_relative_path = store_file_at_relative_path
@@ -30,6 +35,8 @@ class AssetManager:
         self._read_binary_from_uri = read_binary_from_uri
         self._list_files = list_files
         self._delete_file = delete_file
+        self._delete_files = delete_files
+        self._list_files_by_producer = list_files_by_producer
         self._on_change = on_change
 
     def _touch(self) -> None:
@@ -151,20 +158,28 @@ class AssetManager:
         asset_key: str,
         asset_variant: str,
     ) -> None:
-        files = self._list_files()
-        deleted_file_ids: List[str] = []
-        deleted_filenames: List[str] = []
-        for file_meta in files:
-            if not self._matches_asset_metadata(
+        if self._list_files_by_producer is not None:
+            candidates = self._list_files_by_producer(execution.task_id, execution.agent_id)
+        else:
+            candidates = self._list_files()
+        matches = [
+            file_meta
+            for file_meta in candidates
+            if self._matches_asset_metadata(
                 file_meta,
                 execution=execution,
                 asset_key=asset_key,
                 asset_variant=asset_variant,
-            ):
-                continue
-            if self._delete_file(file_meta.id):
-                deleted_file_ids.append(file_meta.id)
-                deleted_filenames.append(file_meta.filename)
+            )
+        ]
+        if not matches:
+            return
+        if self._delete_files is not None:
+            deleted = self._delete_files([file_meta.id for file_meta in matches])
+        else:
+            deleted = [file_meta for file_meta in matches if self._delete_file(file_meta.id)]
+        deleted_file_ids = [file_meta.id for file_meta in deleted]
+        deleted_filenames = [file_meta.filename for file_meta in deleted]
 
         if deleted_file_ids:
             self._add_log(
@@ -233,15 +248,22 @@ class AssetManager:
         deferred_json_snapshots: List[Dict[str, Any]] = []
         deferred_keyframes_manifests: List[Dict[str, Any]] = []
 
+        # Deferred kinds are routed by table; unknown kinds are dropped before
+        # any path validation.
+        deferred_by_kind: Dict[str, List[Dict[str, Any]]] = {
+            "json_snapshot": deferred_json_snapshots,
+            "keyframes_manifest": deferred_keyframes_manifests,
+        }
+
         for raw in assignments:
             if not isinstance(raw, dict):
                 continue
-            kind_early = str(raw.get("kind") or "").strip()
-            if kind_early == "json_snapshot":
-                deferred_json_snapshots.append(raw)
+            kind = str(raw.get("kind") or "").strip()
+            deferred = deferred_by_kind.get(kind)
+            if deferred is not None:
+                deferred.append(raw)
                 continue
-            if kind_early == "keyframes_manifest":
-                deferred_keyframes_manifests.append(raw)
+            if kind not in self._IMMEDIATE_PLAN_KINDS:
                 continue
 
             rel = str(raw.get("relative_path") or "").strip().replace("\\", "/")
@@ -251,7 +273,6 @@ class AssetManager:
             if not self._has_allowed_extension(rel):
                 logger.warning("persist plan: skip disallowed extension path %r", rel)
                 continue
-            kind = str(raw.get("kind") or "").strip()
 
             if kind == "binary":
                 sk = str(raw.get("source_key") or "").strip()
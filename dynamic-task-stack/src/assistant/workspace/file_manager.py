@@ -1,10 +1,11 @@
 # File Manager - Manages all file resources in the workspace
 
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import uuid
 import json
+import sys
 import logging
 import re
 
@@ -12,6 +13,17 @@ from .models import FileMetadata
 
 logger = logging.getLogger(__name__)
 
+_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg'})
+_VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv'})
+_TEXT_EXTENSIONS = frozenset({'.txt', '.md', '.json', '.xml', '.csv'})
+
+# Built once from the sets above: extension -> file type.
+_FILE_TYPE_BY_EXTENSION: Dict[str, str] = {
+    **dict.fromkeys(_IMAGE_EXTENSIONS, 'image'),
+    **dict.fromkeys(_VIDEO_EXTENSIONS, 'video'),
+    **dict.fromkeys(_TEXT_EXTENSIONS, 'text'),
+}
+
 
 class FileManager:
     """
@@ -38,6 +50,18 @@ class FileManager:
         
         # File metadata storage: file_id -> FileMetadata
         self._file_metadata: Dict[str, FileMetadata] = {}
+
+        # Serialized form reused by _save_metadata: file_id -> (FileMetadata, json dict).
+        # Entries are only valid while the stored object is the live one and
+        # unchanged; update_file drops the entry of the file it edits.
+        self._json_cache: Dict[str, Tuple[FileMetadata, Dict[str, Any]]] = {}
+        
+        # (metadata task_id, producer_agent_id) -> file ids, insertion ordered.
+        # Lets asset lookups for one execution skip the full file scan.
+        self._producer_index: Dict[Tuple[str, str], Dict[str, None]] = {}
+
+        # Newest-first view for list_files; dropped on every store/delete.
+        self._newest_first: Optional[List[FileMetadata]] = None
         
         # Monotonic counter for file_id generation
         self._file_counter = 0
@@ -58,8 +82,14 @@ class FileManager:
                     self._file_counter = data.get('counter', 0)
                     for file_id, meta_dict in data.get('files', {}).items():
                         # Convert datetime strings back to datetime objects
+                        json_dict = dict(meta_dict)
                         meta_dict['created_at'] = datetime.fromisoformat(meta_dict['created_at'])
-                        self._file_metadata[file_id] = FileMetadata(**meta_dict)
+                        # One of a few fixed values; share one string object per type.
+                        meta_dict['file_type'] = sys.intern(meta_dict['file_type'])
+                        file_metadata = FileMetadata(**meta_dict)
+                        self._file_metadata[file_id] = file_metadata
+                        self._json_cache[file_id] = (file_metadata, json_dict)
+                        self._index_producer(file_metadata)
             except Exception as e:
                 logger.warning("Failed to load file metadata: %s", e)
 
@@ -77,12 +107,38 @@ class FileManager:
             'file_extension': metadata.file_extension,
             'file_path': metadata.file_path,
             'size_bytes': metadata.size_bytes,
-            'created_at': metadata.created_at.isoformat(),
+            'created_at': metadata.created_at_iso,
             'created_by': metadata.created_by,
             'tags': metadata.tags,
             'metadata': metadata.metadata
         }
 
+    @staticmethod
+    def _producer_key(metadata: FileMetadata) -> Optional[Tuple[str, str]]:
+        extra = metadata.metadata
+        if not isinstance(extra, dict):
+            return None
+        task_id = extra.get("task_id")
+        agent_id = extra.get("producer_agent_id")
+        if isinstance(task_id, str) and isinstance(agent_id, str):
+            return (task_id, agent_id)
+        return None
+
+    def _index_producer(self, metadata: FileMetadata) -> None:
+        key = self._producer_key(metadata)
+        if key is not None:
+            self._producer_index.setdefault(key, {})[metadata.id] = None
+
+    def _unindex_producer(self, metadata: FileMetadata) -> None:
+        key = self._producer_key(metadata)
+        if key is None:
+            return
+        ids = self._producer_index.get(key)
+        if ids is not None:
+            ids.pop(metadata.id, None)
+            if not ids:
+                del self._producer_index[key]
+
     @staticmethod
     def _sort_newest_first(files: List[FileMetadata]) -> List[FileMetadata]:
         return sorted(files, key=lambda x: x.created_at, reverse=True)
@@ -142,8 +198,14 @@ class FileManager:
                 'counter': self._file_counter,
                 'files': {}
             }
+            json_cache = self._json_cache
+            files = data['files']
             for file_id, metadata in self._file_metadata.items():
-                data['files'][file_id] = self._metadata_to_json_dict(metadata)
+                cached = json_cache.get(file_id)
+                if cached is None or cached[0] is not metadata:
+                    cached = (metadata, self._metadata_to_json_dict(metadata))
+                    json_cache[file_id] = cached
+                files[file_id] = cached[1]
             
             with open(metadata_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
@@ -156,18 +218,7 @@ class FileManager:
     
     def _determine_file_type(self, extension: str) -> str:
         """Determine file type from extension"""
-        image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg'}
-        video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv'}
-        text_extensions = {'.txt', '.md', '.json', '.xml', '.csv'}
-        
-        if extension in image_extensions:
-            return 'image'
-        elif extension in video_extensions:
-            return 'video'
-        elif extension in text_extensions:
-            return 'text'
-        else:
-            return 'other'
+        return _FILE_TYPE_BY_EXTENSION.get(extension, 'other')
     
     def store_file_at_relative_path(
         self,
@@ -209,6 +260,8 @@ class FileManager:
             metadata=metadata,
         )
         self._file_metadata[file_id] = file_metadata
+        self._index_producer(file_metadata)
+        self._newest_first = None
         self._save_metadata()
         return file_metadata
     
@@ -244,12 +297,63 @@ class FileManager:
         
         Returns list of FileMetadata instances.
         """
-        results = list(self._file_metadata.values())
+        # Sort by creation time (newest first); the sorted view is kept until
+        # the next store/delete and each caller gets its own copy.
+        if self._newest_first is None:
+            self._newest_first = self._sort_newest_first(list(self._file_metadata.values()))
+        return list(self._newest_first)
 
-        # Sort by creation time (newest first)
-        results = self._sort_newest_first(results)
-        return results
+    def list_files_by_producer(self, task_id: str, agent_id: str) -> List[FileMetadata]:
+        """
+        List files whose metadata has this ``task_id`` and ``producer_agent_id``.
+        
+        Served from an index kept in sync by store/update/delete; newest first like
+        ``list_files``.
+        """
+        ids = self._producer_index.get((task_id, agent_id))
+        if not ids:
+            return []
+        files = self._file_metadata
+        return self._sort_newest_first([files[file_id] for file_id in ids])
     
+    def update_file(
+        self,
+        file_id: str,
+        *,
+        description: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Optional[FileMetadata]:
+        """
+        Update a file's description, tags or metadata
+        
+        Stored ``FileMetadata`` objects must only be changed here: the file's
+        serialized entry is dropped so the next save re-encodes it.
+        
+        Args:
+            file_id: File ID to update
+            description: New description (unchanged if None)
+            tags: New tag list (unchanged if None)
+            metadata: New metadata dict (unchanged if None)
+        
+        Returns:
+            The updated FileMetadata, or None if the file does not exist
+        """
+        file_metadata = self._file_metadata.get(file_id)
+        if file_metadata is None:
+            return None
+        self._unindex_producer(file_metadata)
+        if description is not None:
+            file_metadata.description = description
+        if tags is not None:
+            file_metadata.tags = list(tags)
+        if metadata is not None:
+            file_metadata.metadata = dict(metadata)
+        self._index_producer(file_metadata)
+        self._json_cache.pop(file_id, None)
+        self._save_metadata()
+        return file_metadata
+
     def delete_file(self, file_id: str) -> bool:
         """
         Delete a file from the workspace
@@ -260,9 +364,38 @@ class FileManager:
         Returns:
             True if deleted successfully, False otherwise
         """
-        metadata = self._file_metadata.get(file_id)
-        if metadata is None:
+        if self._remove_file_entry(file_id) is None:
             return False
+        self._save_metadata()
+        return True
+
+    def delete_files(self, file_ids: List[str]) -> List[FileMetadata]:
+        """
+        Delete several files, saving ``.file_metadata.json`` once
+        
+        Args:
+            file_ids: File IDs to delete; unknown IDs are ignored
+        
+        Returns:
+            Metadata of the files that were deleted, in input order
+        """
+        deleted: List[FileMetadata] = []
+        for file_id in file_ids:
+            metadata = self._remove_file_entry(file_id)
+            if metadata is not None:
+                deleted.append(metadata)
+        if deleted:
+            self._save_metadata()
+        return deleted
+
+    def _remove_file_entry(self, file_id: str) -> Optional[FileMetadata]:
+        """Unlink the file and drop its metadata without saving."""
+        metadata = self._file_metadata.pop(file_id, None)
+        if metadata is None:
+            return None
+        self._json_cache.pop(file_id, None)
+        self._unindex_producer(metadata)
+        self._newest_first = None
         
         # Delete file from disk
         file_path = Path(metadata.file_path)
@@ -271,10 +404,5 @@ class FileManager:
                 file_path.unlink()
             except Exception as e:
                 logger.warning("Failed to delete file %s: %s", file_path, e)
-        
-        # Remove from metadata
-        del self._file_metadata[file_id]
-        self._save_metadata()
-        
-        return True
+        return metadata
     
@@ -1,6 +1,8 @@
 # Log Manager - Manages logs and records
 
+import heapq
 import json
+import sys
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -37,6 +39,10 @@ class LogManager:
         
         # In-memory log cache
         self._logs: List[LogEntry] = []
+
+        # Append-only inverted indexes: agent_id / task_id -> positions in _logs
+        self._agent_index: Dict[str, List[int]] = {}
+        self._task_index: Dict[str, List[int]] = {}
         
         # Ensure workspace directory exists
         self.workspace_runtime_path.mkdir(parents=True, exist_ok=True)
@@ -52,7 +58,7 @@ class LogManager:
     def _log_to_json_dict(log_entry: LogEntry) -> Dict[str, Any]:
         return {
             'id': log_entry.id,
-            'timestamp': log_entry.timestamp.isoformat(),
+            'timestamp': log_entry.timestamp_iso,
             'operation_type': log_entry.operation_type,
             'resource_type': log_entry.resource_type,
             'resource_id': log_entry.resource_id,
@@ -68,6 +74,9 @@ class LogManager:
             return None
         data = json.loads(line)
         data['timestamp'] = datetime.fromisoformat(data['timestamp'])
+        # Small closed vocabularies; share one string object per value.
+        data['operation_type'] = sys.intern(data['operation_type'])
+        data['resource_type'] = sys.intern(data['resource_type'])
         return LogEntry(**data)
 
     @staticmethod
@@ -89,9 +98,40 @@ class LogManager:
             return False
         return True
 
+    def _append_entry(self, log_entry: LogEntry) -> None:
+        """Add to the in-memory cache and its indexes."""
+        pos = len(self._logs)
+        self._logs.append(log_entry)
+        if log_entry.agent_id:
+            self._agent_index.setdefault(log_entry.agent_id, []).append(pos)
+        if log_entry.task_id:
+            self._task_index.setdefault(log_entry.task_id, []).append(pos)
+
+    def _candidate_logs(
+        self,
+        agent_id: Optional[str],
+        task_id: Optional[str],
+    ) -> List[LogEntry]:
+        """Logs that may match, in append order, narrowed by the smallest index hit."""
+        postings: Optional[List[int]] = None
+        if agent_id:
+            postings = self._agent_index.get(agent_id, [])
+        if task_id:
+            task_postings = self._task_index.get(task_id, [])
+            if postings is None or len(task_postings) < len(postings):
+                postings = task_postings
+        if postings is None:
+            return self._logs
+        logs = self._logs
+        return [logs[pos] for pos in postings]
+
+    @staticmethod
+    def _timestamp_key(log_entry: LogEntry) -> datetime:
+        return log_entry.timestamp
+
     @staticmethod
     def _sort_newest_first(logs: List[LogEntry]) -> List[LogEntry]:
-        return sorted(logs, key=lambda x: x.timestamp, reverse=True)
+        return sorted(logs, key=LogManager._timestamp_key, reverse=True)
 
     def _load_logs(self):
         """Load logs from disk"""
@@ -104,7 +144,7 @@ class LogManager:
                     try:
                         log_entry = self._parse_log_line(line)
                         if log_entry:
-                            self._logs.append(log_entry)
+                            self._append_entry(log_entry)
                     except Exception as e:
                         logger.warning("Failed to parse log entry: %s", e)
         except Exception as e:
@@ -144,8 +184,8 @@ class LogManager:
         log_entry = LogEntry(
             id=f"log_{uuid.uuid4().hex[:12]}",
             timestamp=datetime.now(),
-            operation_type=operation_type,
-            resource_type=resource_type,
+            operation_type=sys.intern(operation_type),
+            resource_type=sys.intern(resource_type),
             resource_id=resource_id,
             details=details or {},
             agent_id=agent_id,
@@ -153,7 +193,7 @@ class LogManager:
         )
         
         # Add to in-memory cache
-        self._logs.append(log_entry)
+        self._append_entry(log_entry)
         
         # Append to file
         self._append_log_to_file(log_entry)
@@ -181,9 +221,11 @@ class LogManager:
         Returns:
             List of LogEntry instances
         """
-        results = [
+        # agent_id / task_id narrow the scan through the indexes; the remaining
+        # filters are still checked per entry.
+        matches = (
             log_entry
-            for log_entry in self._logs
+            for log_entry in self._candidate_logs(agent_id, task_id)
             if self._matches_filters(
                 log_entry,
                 operation_type=operation_type,
@@ -191,14 +233,14 @@ class LogManager:
                 agent_id=agent_id,
                 task_id=task_id,
             )
-        ]
+        )
 
-        # Sort by timestamp (newest first)
-        results = self._sort_newest_first(results)
-        
-        # Apply limit
+        # Newest first; with a limit only the top ``limit`` are kept
+        # (nlargest matches sorted(..., reverse=True)[:limit], ties included).
+        if limit and limit > 0:
+            return heapq.nlargest(limit, matches, key=self._timestamp_key)
+        results = self._sort_newest_first(list(matches))
         if limit:
             results = results[:limit]
-        
         return results
     
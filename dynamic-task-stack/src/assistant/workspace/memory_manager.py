@@ -8,7 +8,7 @@ import os
 import re
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +42,13 @@ class MemoryManager:
 
     This file does **not** embed a workspace file-tree dump (too noisy for large runs).
     Use **live** ``get_workspace_root_file_tree_text`` and per-entry ``artifact_locations``.
+
+    Parsed entries are cached in memory and reused while the file's
+    ``(mtime_ns, size)`` is unchanged; writes through this manager refresh the
+    cache directly. Entries returned by the read methods are shared with the
+    cache and must be treated as read-only. ``memory_version`` changes whenever
+    the cached entries are replaced, so callers can key their own derived caches
+    on it.
     """
 
     MAX_ENTRY_COUNT = 2000
@@ -51,6 +58,13 @@ class MemoryManager:
         self.runtime_base_path = Path(runtime_base_path)
         self.workspace_runtime_path = self.runtime_base_path / workspace_id
         self.workspace_runtime_path.mkdir(parents=True, exist_ok=True)
+        self._entries_cache: Optional[Tuple[Tuple[int, int], List[Dict[str, Any]]]] = None
+        # Signature of the file as last written by this manager; while it still
+        # matches, the on-disk document is exactly what refresh would produce.
+        self._written_sig: Optional[Tuple[int, int]] = None
+        self._version = 0
+        # (memory_version, entries sorted newest first) for brief / routing reads.
+        self._newest_first_cache: Optional[Tuple[int, List[Dict[str, Any]]]] = None
 
     @staticmethod
     def _require_task_id(task_id: Optional[str]) -> str:
@@ -156,8 +170,35 @@ class MemoryManager:
         logger.warning("global_memory.md present but JSON entries block missing or invalid: %s", path)
         return []
 
+    @staticmethod
+    def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
     def _read_entries_aggregate(self) -> List[Dict[str, Any]]:
-        return self._read_entries_from_file(self._global_memory_path())
+        """Parsed entries, re-read from disk only when the file changed."""
+        path = self._global_memory_path()
+        sig = self._file_signature(path)
+        if sig is None:
+            if self._entries_cache is not None:
+                self._entries_cache = None
+                self._version += 1
+            return []
+        cached = self._entries_cache
+        if cached is not None and cached[0] == sig:
+            return cached[1]
+        entries = self._read_entries_from_file(path)
+        self._entries_cache = (sig, entries)
+        self._version += 1
+        return entries
+
+    def memory_version(self) -> int:
+        """Counter bumped each time the parsed entries change (write or external edit)."""
+        self._read_entries_aggregate()
+        return self._version
 
     def _build_file_tree_text(self, root: Path) -> str:
         lines: List[str] = []
@@ -205,13 +246,29 @@ class MemoryManager:
                 encoding="utf-8",
             )
         except Exception as exc:
+            self._entries_cache = None
+            self._written_sig = None
+            self._version += 1
             logger.warning("Failed to write global_memory.md at %s: %s", path, exc)
             raise
+        sig = self._file_signature(path)
+        self._written_sig = sig
+        self._entries_cache = (
+            (sig, [e for e in entries if e.get("content")]) if sig is not None else None
+        )
+        self._version += 1
 
     def refresh_file_tree(self) -> None:
-        """Rewrite ``global_memory.md`` from disk entries (e.g. after file store/delete)."""
+        """Rewrite ``global_memory.md`` from disk entries (e.g. after file store/delete).
+
+        Skipped when the file is unchanged since this manager last wrote it: the
+        document no longer embeds a file tree, so the rewrite would be identical.
+        """
         path = self._global_memory_path()
-        entries = self._read_entries_from_file(path)
+        sig = self._file_signature(path)
+        if sig is not None and sig == self._written_sig:
+            return
+        entries = self._read_entries_aggregate()
         self._write_global_memory_file(path, entries)
 
     def add_memory_entry(
@@ -241,8 +298,8 @@ class MemoryManager:
             entry["artifact_locations"] = al
 
         path = self._global_memory_path()
-        entries = self._read_entries_from_file(path) if path.exists() else []
-        entries.append(entry)
+        entries = list(self._read_entries_aggregate())
+        entries.append(dict(entry))
         if len(entries) > self.MAX_ENTRY_COUNT:
             entries = entries[-self.MAX_ENTRY_COUNT :]
         self._write_global_memory_file(path, entries)
@@ -255,21 +312,21 @@ class MemoryManager:
         agent_id: Optional[str] = None,
         limit: int = 20,
     ) -> List[Dict[str, Any]]:
-        pool = self._read_entries_aggregate()
-        if task_id:
-            want = self._require_task_id(task_id)
-            pool = [x for x in pool if isinstance(x, dict) and x.get("task_id") == want]
-
+        want = self._require_task_id(task_id) if task_id else None
+        # One newest-first pass applies both filters and stops at the limit.
         filtered: List[Dict[str, Any]] = []
-        for item in reversed(pool):
+        for item in reversed(self._read_entries_aggregate()):
             if not isinstance(item, dict):
                 continue
+            if want is not None and item.get("task_id") != want:
+                continue
             if agent_id and item.get("agent_id") != agent_id:
                 continue
             filtered.append(item)
             if len(filtered) >= limit:
                 break
-        return list(reversed(filtered))
+        filtered.reverse()
+        return filtered
 
     @staticmethod
     def _created_at_sort_key(entry: Dict[str, Any]) -> str:
@@ -292,21 +349,34 @@ class MemoryManager:
             out.append({k: e[k] for k in cls._BRIEF_ROW_KEYS if k in e})
         return out
 
+    def _entries_newest_first(self) -> List[Dict[str, Any]]:
+        """All entries sorted by ``created_at`` descending, sorted once per memory version."""
+        entries = self._read_entries_aggregate()
+        cached = self._newest_first_cache
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        ordered = sorted(
+            (x for x in entries if isinstance(x, dict)),
+            key=self._created_at_sort_key,
+            reverse=True,
+        )
+        self._newest_first_cache = (self._version, ordered)
+        return ordered
+
     def _collect_candidates(
         self,
         task_id: Optional[str],
         agent_id: Optional[str],
     ) -> List[Dict[str, Any]]:
-        candidates = [
-            x for x in self._read_entries_aggregate() if isinstance(x, dict)
+        # Filtering the shared sorted view keeps the same order as sorting the
+        # filtered rows (the sort is stable); the result is a fresh list.
+        want = self._require_task_id(task_id) if task_id else None
+        return [
+            x
+            for x in self._entries_newest_first()
+            if (want is None or x.get("task_id") == want)
+            and (not agent_id or x.get("agent_id") == agent_id)
         ]
-        if task_id:
-            want = self._require_task_id(task_id)
-            candidates = [x for x in candidates if x.get("task_id") == want]
-        if agent_id:
-            candidates = [x for x in candidates if x.get("agent_id") == agent_id]
-        candidates.sort(key=self._created_at_sort_key, reverse=True)
-        return candidates
 
     def get_memory_brief(
         self,
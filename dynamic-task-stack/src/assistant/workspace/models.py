@@ -5,6 +5,16 @@ from datetime import datetime
 from typing import Dict, Any, Optional, List
 
 
+def _cached_isoformat(obj: Any, slot: str, value: datetime) -> str:
+    # Stored outside the dataclass fields (so eq/asdict ignore it) together with
+    # the datetime it was built from; reassigning the field invalidates it.
+    cached = obj.__dict__.get(slot)
+    if cached is None or cached[0] is not value:
+        cached = (value, value.isoformat())
+        obj.__dict__[slot] = cached
+    return cached[1]
+
+
 @dataclass
 class FileMetadata:
     """Metadata for a file in the workspace"""
@@ -20,6 +30,11 @@ class FileMetadata:
     tags: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)  # Additional metadata
 
+    @property
+    def created_at_iso(self) -> str:
+        """``created_at.isoformat()``, computed once per timestamp value."""
+        return _cached_isoformat(self, "_created_at_iso", self.created_at)
+
 
 @dataclass
 class LogEntry:
@@ -32,3 +47,9 @@ class LogEntry:
     details: Dict[str, Any] = field(default_factory=dict)
     agent_id: Optional[str] = None
     task_id: Optional[str] = None
+
+    @property
+    def timestamp_iso(self) -> str:
+        """``timestamp.isoformat()``, computed once per timestamp value."""
+        return _cached_isoformat(self, "_timestamp_iso", self.timestamp)
+
@@ -1,8 +1,10 @@
 # Workspace - Main workspace class that coordinates all managers
 
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from threading import Lock
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
+import time
 
 from .file_manager import FileManager
 from .memory_manager import MemoryManager
@@ -22,6 +24,10 @@ class Workspace:
 
     Each workspace has its own directory in Runtime/{workspace_id}/
     """
+
+    # The root file tree walks the whole runtime directory; reuse the text for
+    # this long. Changes made through this facade invalidate it immediately.
+    FILE_TREE_CACHE_TTL_SEC = 2.0
     
     def __init__(self, workspace_id: str, runtime_base_path: Path):
         """
@@ -35,6 +41,8 @@ class Workspace:
         self.runtime_base_path = Path(runtime_base_path)
         self.created_at = datetime.now()
         self.updated_at = datetime.now()
+        self._file_tree_cache: Optional[Tuple[float, str]] = None
+        self._file_tree_lock = Lock()
         
         # Initialize managers
         self.file_manager = FileManager(workspace_id, runtime_base_path)
@@ -46,6 +54,8 @@ class Workspace:
             self.file_manager.read_binary_from_uri,
             self.list_files,
             self.delete_file,
+            delete_files=self.delete_files,
+            list_files_by_producer=self.list_files_by_producer,
             on_change=self._touch,
         )
         
@@ -63,6 +73,7 @@ class Workspace:
 
     def _touch(self) -> None:
         self.updated_at = datetime.now()
+        self._file_tree_cache = None
 
     def _add_log(
         self,
@@ -128,6 +139,35 @@ class Workspace:
     def list_files(self) -> List[FileMetadata]:
         """List files in workspace."""
         return self.file_manager.list_files()
+
+    def list_files_by_producer(self, task_id: str, agent_id: str) -> List[FileMetadata]:
+        """List files produced by ``agent_id`` for ``task_id`` (indexed, newest first)."""
+        return self.file_manager.list_files_by_producer(task_id, agent_id)
+    
+    def update_file(
+        self,
+        file_id: str,
+        *,
+        description: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Optional[FileMetadata]:
+        """Update a file's description, tags or metadata (None leaves a field unchanged)."""
+        file_meta = self.file_manager.update_file(
+            file_id,
+            description=description,
+            tags=tags,
+            metadata=metadata,
+        )
+        if file_meta is not None:
+            self._add_log(
+                operation_type='update',
+                resource_type='file',
+                resource_id=file_id,
+                details={'filename': file_meta.filename}
+            )
+            self._touch()
+        return file_meta
     
     def delete_file(self, file_id: str) -> bool:
         """Delete a file from the workspace"""
@@ -145,6 +185,21 @@ class Workspace:
                 self._touch()
             return success
         return False
+
+    def delete_files(self, file_ids: List[str]) -> List[FileMetadata]:
+        """Delete several files with one metadata save and one memory refresh."""
+        deleted = self.file_manager.delete_files(file_ids)
+        for file_meta in deleted:
+            self._add_log(
+                operation_type='delete',
+                resource_type='file',
+                resource_id=file_meta.id,
+                details={'filename': file_meta.filename}
+            )
+        if deleted:
+            self.memory_manager.refresh_file_tree()
+            self._touch()
+        return deleted
     
     def add_memory_entry(
         self,
@@ -202,9 +257,24 @@ class Workspace:
             limit=limit,
         )
 
+    def memory_version(self) -> int:
+        """Counter that changes whenever global memory entries change."""
+        return self.memory_manager.memory_version()
+
     def get_workspace_root_file_tree_text(self) -> str:
-        """Full file tree under workspace runtime root (includes ``artifacts/``); for persist-path LLM."""
-        return self.memory_manager.workspace_root_file_tree_text()
+        """Full file tree under workspace runtime root (includes ``artifacts/``); for persist-path LLM.
+
+        Cached for ``FILE_TREE_CACHE_TTL_SEC`` (files written outside the facade
+        show up after that); any facade write drops the cache.
+        """
+        with self._file_tree_lock:
+            cached = self._file_tree_cache
+            now = time.monotonic()
+            if cached is not None and now - cached[0] < self.FILE_TREE_CACHE_TTL_SEC:
+                return cached[1]
+            text = self.memory_manager.workspace_root_file_tree_text()
+            self._file_tree_cache = (now, text)
+            return text
 
     # Log Methods
     
@@ -2,21 +2,107 @@
 
 from __future__ import annotations
 
+import gzip
 from enum import Enum
 from typing import Any, Callable, Optional, TypeVar
 
-from flask import jsonify, request
+import orjson
+from flask import current_app, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 
 EnumT = TypeVar("EnumT", bound=Enum)
 
+# JSON bodies smaller than this are sent uncompressed (gzip overhead dominates).
+GZIP_MIN_SIZE = 1024
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """``app.json`` provider that encodes/decodes with orjson.
+
+    Unlike ``DefaultJSONProvider`` it defaults to unsorted keys (insertion
+    order) and compact output even in debug; set ``sort_keys`` / ``compact``
+    on the instance to get Flask's behaviour back. Keeps the trailing newline
+    and the ``default`` fallback for dates (HTTP date) and dataclasses. Calls
+    with extra ``json`` kwargs go to the stdlib implementation.
+    """
+
+    sort_keys = False
+    compact = True
+
+    _BASE_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+    def _options(self) -> int:
+        if self.sort_keys:
+            return self._BASE_OPTIONS | orjson.OPT_SORT_KEYS
+        return self._BASE_OPTIONS
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        option = self._options() | orjson.OPT_APPEND_NEWLINE
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        # orjson returns UTF-8 bytes, so the body skips the str -> bytes encode.
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=option),
+            mimetype=self.mimetype,
+        )
+
+
+def gzip_json_response(response):
+    """``after_request`` hook: gzip JSON bodies when the client accepts it.
+
+    File/log/memory listings repeat the same keys on every row and compress
+    well; small, streamed, non-2xx or already-encoded responses are untouched.
+    """
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or not 200 <= response.status_code < 300
+        or response.status_code == 204
+        or response.mimetype != "application/json"
+        or "Content-Encoding" in response.headers
+        or not request.accept_encodings.quality("gzip")
+    ):
+        return response
+    data = response.get_data()
+    if len(data) < GZIP_MIN_SIZE:
+        return response
+    response.set_data(gzip.compress(data, compresslevel=6, mtime=0))
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
 
 def bad_request(message: str):
     return jsonify({"error": message}), 400
 
 
 def json_body_or_error(*, allow_empty: bool = False):
-    """Parse JSON body; reject null body; optionally reject empty object."""
-    data = request.get_json()
+    """Parse JSON body; reject null body; optionally reject empty object.
+
+    Decodes the raw body with the app's JSON provider (orjson) directly:
+    no ``Content-Type`` check and no cached copy of the body. Malformed or
+    missing JSON gets the same ``400 {"error": "Invalid JSON body"}``.
+    """
+    raw = request.get_data(cache=False)
+    try:
+        data = current_app.json.loads(raw) if raw else None
+    except ValueError:
+        data = None
     if data is None:
         return None, bad_request("Invalid JSON body")
     if not allow_empty and not data:
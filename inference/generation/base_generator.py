@@ -5,14 +5,83 @@ Provides abstract base classes that all generators must inherit from,
 with automatic parameter validation based on input_schema.
 """
 
+import json
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Union
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
 
-@dataclass
+_TYPE_MAPPING: Dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "float": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+InputValidator = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+# Compiled validators shared by every generator with an identical schema.
+_VALIDATOR_CACHE: Dict[str, InputValidator] = {}
+
+
+def _passthrough_validator(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    return inputs
+
+
+def _build_input_validator(schema: Dict[str, Any]) -> InputValidator:
+    """Turn an input_schema into a closure over pre-extracted field specs."""
+    specs: Tuple[Tuple[str, Any, str, bool, Any], ...] = tuple(
+        (
+            field_name,
+            _TYPE_MAPPING.get(field_spec.get("type", "string")),
+            field_spec.get("type", "string"),
+            bool(field_spec.get("required", False)),
+            field_spec.get("default"),
+        )
+        for field_name, field_spec in schema.items()
+        if isinstance(field_spec, dict)
+    )
+
+    def validate(inputs: Dict[str, Any]) -> Dict[str, Any]:
+        validated: Dict[str, Any] = {}
+        for field_name, python_type, field_type, required, default in specs:
+            if field_name in inputs:
+                value = inputs[field_name]
+                # Unknown types (python_type is None) skip type validation.
+                if python_type is not None and not isinstance(value, python_type):
+                    raise ValueError(
+                        f"Field '{field_name}' must be of type {field_type}, got {type(value).__name__}"
+                    )
+                validated[field_name] = value
+            elif required:
+                raise ValueError(f"Required field '{field_name}' is missing")
+            elif default is not None:
+                validated[field_name] = default
+        return validated
+
+    return validate
+
+
+def _compile_input_validator(schema: Dict[str, Any]) -> InputValidator:
+    """Return the (cached) validator for an input_schema.
+
+    Validators are cached on the schema's canonical JSON text, so
+    generators declaring the same schema share one compiled closure.
+    """
+    if not schema:
+        return _passthrough_validator
+    key = json.dumps(schema, sort_keys=True, default=repr)
+    validator = _VALIDATOR_CACHE.get(key)
+    if validator is None:
+        validator = _VALIDATOR_CACHE[key] = _build_input_validator(schema)
+    return validator
+
+
+@dataclass(slots=True)
 class GeneratorMetadata:
     """Metadata for a generator"""
     id: str
@@ -23,8 +92,42 @@ class GeneratorMetadata:
     capabilities: List[str] = field(default_factory=list)
     input_schema: Dict[str, Any] = field(default_factory=dict)
     output_schema: Dict[str, Any] = field(default_factory=dict)
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    # Left as None to mean "now"; __post_init__ fills both from one clock read.
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    def __post_init__(self) -> None:
+        if self.created_at is None:
+            self.created_at = datetime.now()
+        if self.updated_at is None:
+            self.updated_at = self.created_at
+
+
+def _generator_info(generator: Any) -> Dict[str, Any]:
+    """Build (or reuse) the ``get_info`` payload for a generator.
+
+    The payload only changes when the metadata object is replaced or its
+    ``updated_at`` moves, so it is cached on the generator and a shallow
+    copy is returned to keep callers from mutating the cached dict.
+    """
+    metadata = generator.metadata
+    cached = generator.__dict__.get("_info_cache")
+    if cached is None or cached[0] is not metadata or cached[1] != metadata.updated_at:
+        info = {
+            "id": metadata.id,
+            "name": metadata.name,
+            "description": metadata.description,
+            "version": metadata.version,
+            "author": metadata.author,
+            "capabilities": metadata.capabilities,
+            "input_schema": metadata.input_schema,
+            "output_schema": metadata.output_schema,
+            "created_at": metadata.created_at.isoformat(),
+            "updated_at": metadata.updated_at.isoformat(),
+        }
+        cached = (metadata, metadata.updated_at, info)
+        generator._info_cache = cached
+    return dict(cached[2])
 
 
 class BaseImageGenerator(ABC):
@@ -68,6 +171,7 @@ class BaseImageGenerator(ABC):
     def __init__(self):
         """Initialize the generator"""
         self.metadata = self.get_metadata()
+        self._input_validator = _compile_input_validator(self.metadata.input_schema)
     
     @abstractmethod
     def get_metadata(self) -> GeneratorMetadata:
@@ -112,54 +216,15 @@ class BaseImageGenerator(ABC):
         Raises:
             ValueError: If inputs are invalid
         """
-        schema = self.metadata.input_schema
-        if not schema:
-            return inputs
-        
-        validated = {}
-        
-        # Process each field in schema
-        for field_name, field_spec in schema.items():
-            if not isinstance(field_spec, dict):
-                continue
-            
-            field_type = field_spec.get("type", "string")
-            required = field_spec.get("required", False)
-            default = field_spec.get("default")
-            
-            # Check if field is provided
-            if field_name in inputs:
-                value = inputs[field_name]
-                # Type validation
-                if not self._validate_type(value, field_type):
-                    raise ValueError(
-                        f"Field '{field_name}' must be of type {field_type}, got {type(value).__name__}"
-                    )
-                validated[field_name] = value
-            elif required:
-                raise ValueError(f"Required field '{field_name}' is missing")
-            elif default is not None:
-                validated[field_name] = default
-        
-        return validated
+        return self._input_validator(inputs)
     
     def _validate_type(self, value: Any, expected_type: str) -> bool:
         """Validate value type"""
-        type_mapping = {
-            "string": str,
-            "integer": int,
-            "float": (int, float),
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-        }
-        
-        if expected_type in type_mapping:
-            expected_python_type = type_mapping[expected_type]
-            return isinstance(value, expected_python_type)
-        
-        return True  # Unknown type, skip validation
-    
+        expected_python_type = _TYPE_MAPPING.get(expected_type)
+        if expected_python_type is None:
+            return True  # Unknown type, skip validation
+        return isinstance(value, expected_python_type)
+
     def get_input_schema(self) -> Dict[str, Any]:
         """Get the input schema for this generator"""
         return self.metadata.input_schema
@@ -170,18 +235,7 @@ class BaseImageGenerator(ABC):
     
     def get_info(self) -> Dict[str, Any]:
         """Get complete information about this generator"""
-        return {
-            "id": self.metadata.id,
-            "name": self.metadata.name,
-            "description": self.metadata.description,
-            "version": self.metadata.version,
-            "author": self.metadata.author,
-            "capabilities": self.metadata.capabilities,
-            "input_schema": self.metadata.input_schema,
-            "output_schema": self.metadata.output_schema,
-            "created_at": self.metadata.created_at.isoformat(),
-            "updated_at": self.metadata.updated_at.isoformat(),
-        }
+        return _generator_info(self)
 
 
 class BaseVideoGenerator(ABC):
@@ -221,6 +275,7 @@ class BaseVideoGenerator(ABC):
     def __init__(self):
         """Initialize the generator"""
         self.metadata = self.get_metadata()
+        self._input_validator = _compile_input_validator(self.metadata.input_schema)
     
     @abstractmethod
     def get_metadata(self) -> GeneratorMetadata:
@@ -262,54 +317,15 @@ class BaseVideoGenerator(ABC):
         Raises:
             ValueError: If inputs are invalid
         """
-        schema = self.metadata.input_schema
-        if not schema:
-            return inputs
-        
-        validated = {}
-        
-        # Process each field in schema
-        for field_name, field_spec in schema.items():
-            if not isinstance(field_spec, dict):
-                continue
-            
-            field_type = field_spec.get("type", "string")
-            required = field_spec.get("required", False)
-            default = field_spec.get("default")
-            
-            # Check if field is provided
-            if field_name in inputs:
-                value = inputs[field_name]
-                # Type validation
-                if not self._validate_type(value, field_type):
-                    raise ValueError(
-                        f"Field '{field_name}' must be of type {field_type}, got {type(value).__name__}"
-                    )
-                validated[field_name] = value
-            elif required:
-                raise ValueError(f"Required field '{field_name}' is missing")
-            elif default is not None:
-                validated[field_name] = default
-        
-        return validated
+        return self._input_validator(inputs)
     
     def _validate_type(self, value: Any, expected_type: str) -> bool:
         """Validate value type"""
-        type_mapping = {
-            "string": str,
-            "integer": int,
-            "float": (int, float),
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-        }
-        
-        if expected_type in type_mapping:
-            expected_python_type = type_mapping[expected_type]
-            return isinstance(value, expected_python_type)
-        
-        return True  # Unknown type, skip validation
-    
+        expected_python_type = _TYPE_MAPPING.get(expected_type)
+        if expected_python_type is None:
+            return True  # Unknown type, skip validation
+        return isinstance(value, expected_python_type)
+
     def get_input_schema(self) -> Dict[str, Any]:
         """Get the input schema for this generator"""
         return self.metadata.input_schema
@@ -320,18 +336,7 @@ class BaseVideoGenerator(ABC):
     
     def get_info(self) -> Dict[str, Any]:
         """Get complete information about this generator"""
-        return {
-            "id": self.metadata.id,
-            "name": self.metadata.name,
-            "description": self.metadata.description,
-            "version": self.metadata.version,
-            "author": self.metadata.author,
-            "capabilities": self.metadata.capabilities,
-            "input_schema": self.metadata.input_schema,
-            "output_schema": self.metadata.output_schema,
-            "created_at": self.metadata.created_at.isoformat(),
-            "updated_at": self.metadata.updated_at.isoformat(),
-        }
+        return _generator_info(self)
 
 
 class BaseAudioGenerator(ABC):
@@ -345,6 +350,7 @@ class BaseAudioGenerator(ABC):
 
     def __init__(self):
         self.metadata = self.get_metadata()
+        self._input_validator = _compile_input_validator(self.metadata.input_schema)
 
     @abstractmethod
     def get_metadata(self) -> GeneratorMetadata:
@@ -358,46 +364,14 @@ class BaseAudioGenerator(ABC):
 
     def validate_inputs(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Validate and normalize inputs against metadata.input_schema."""
-        schema = self.metadata.input_schema
-        if not schema:
-            return inputs
-
-        validated: Dict[str, Any] = {}
-        for field_name, field_spec in schema.items():
-            if not isinstance(field_spec, dict):
-                continue
-
-            field_type = field_spec.get("type", "string")
-            required = field_spec.get("required", False)
-            default = field_spec.get("default")
-
-            if field_name in inputs:
-                value = inputs[field_name]
-                if not self._validate_type(value, field_type):
-                    raise ValueError(
-                        f"Field '{field_name}' must be of type {field_type}, got {type(value).__name__}"
-                    )
-                validated[field_name] = value
-            elif required:
-                raise ValueError(f"Required field '{field_name}' is missing")
-            elif default is not None:
-                validated[field_name] = default
-
-        return validated
+        return self._input_validator(inputs)
 
     def _validate_type(self, value: Any, expected_type: str) -> bool:
         """Validate value type."""
-        type_mapping = {
-            "string": str,
-            "integer": int,
-            "float": (int, float),
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-        }
-        if expected_type in type_mapping:
-            return isinstance(value, type_mapping[expected_type])
-        return True
+        expected_python_type = _TYPE_MAPPING.get(expected_type)
+        if expected_python_type is None:
+            return True  # Unknown type, skip validation
+        return isinstance(value, expected_python_type)
 
     def get_input_schema(self) -> Dict[str, Any]:
         return self.metadata.input_schema
@@ -406,15 +380,4 @@ class BaseAudioGenerator(ABC):
         return self.metadata.output_schema
 
     def get_info(self) -> Dict[str, Any]:
-        return {
-            "id": self.metadata.id,
-            "name": self.metadata.name,
-            "description": self.metadata.description,
-            "version": self.metadata.version,
-            "author": self.metadata.author,
-            "capabilities": self.metadata.capabilities,
-            "input_schema": self.metadata.input_schema,
-            "output_schema": self.metadata.output_schema,
-            "created_at": self.metadata.created_at.isoformat(),
-            "updated_at": self.metadata.updated_at.isoformat(),
-        }
+        return _generator_info(self)
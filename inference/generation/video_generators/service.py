@@ -57,6 +57,22 @@ class VideoService:
             "VideoService.generate_clip() must be overridden by a concrete backend."
         )
 
+    async def generate_clips_batch(
+        self,
+        requests: list[dict[str, Any]],
+    ) -> list[bytes | BaseException]:
+        """Generate several clips; one ``generate_clip`` kwargs dict per entry.
+
+        The default runs the per-clip calls concurrently.  Backends that
+        accept batched inference should override this to submit a single
+        request.  Results keep the order of *requests*; a failed clip is
+        returned as its exception so one bad shot does not drop the batch.
+        """
+        return await asyncio.gather(
+            *(self.generate_clip(**request) for request in requests),
+            return_exceptions=True,
+        )
+
     async def assemble_scene(
         self,
         *,
@@ -158,7 +174,12 @@ class VideoService:
 
 
 class MockVideoService(VideoService):
-    """Mock backend that returns minimal placeholder MP4 bytes."""
+    """Mock backend that returns minimal placeholder MP4 bytes.
+
+    Every method returns the shared ``_MOCK_MP4_HEADER`` without awaiting
+    anything; logging is guarded so bulk test runs with INFO disabled do
+    not pay for building log calls per shot.
+    """
 
     async def generate_clip(
         self,
@@ -172,11 +193,12 @@ class MockVideoService(VideoService):
         height: int = 576,
         **kwargs: Any,
     ) -> bytes:
-        logger.info(
-            "[MockVideoService] Generating placeholder clip for %s (%.1fs)",
-            shot_id,
-            duration_sec,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[MockVideoService] Generating placeholder clip for %s (%.1fs)",
+                shot_id,
+                duration_sec,
+            )
         return _MOCK_MP4_HEADER
 
     async def assemble_scene(
@@ -186,7 +208,8 @@ class MockVideoService(VideoService):
         clip_bytes_list: list[bytes],
         transitions: list[dict[str, Any]] | None = None,
     ) -> bytes:
-        logger.info("[MockVideoService] Assembling scene %s", scene_id)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[MockVideoService] Assembling scene %s", scene_id)
         return _MOCK_MP4_HEADER
 
     async def assemble_final(
@@ -194,7 +217,8 @@ class MockVideoService(VideoService):
         *,
         scene_bytes_list: list[bytes],
     ) -> bytes:
-        logger.info("[MockVideoService] Assembling final video")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[MockVideoService] Assembling final video")
         return _MOCK_MP4_HEADER
 
 
@@ -81,6 +81,31 @@ class TestAgentRegistryDescriptorModel:
         registry.reload()
         assert registry.gather_agents_info()["agent_ids"] == []
 
+    def test_gather_agents_info_is_cached_per_registry_version(self):
+        registry = AgentRegistry()
+        registry.register_pipeline_agents({"StoryAgent": _DummyDescriptor("StoryAgent")})
+        first = registry.gather_agents_info()
+        assert registry.gather_agents_info() is first
+
+        version = registry.version
+        registry.register_pipeline_agents({"StoryAgent": _DummyDescriptor("StoryAgent")})
+        assert registry.version == version
+        registry.register_pipeline_agents({"AudioAgent": _DummyDescriptor("AudioAgent")})
+        assert registry.version != version
+        assert registry.gather_agents_info()["agent_ids"] == ["StoryAgent", "AudioAgent"]
+
+    def test_get_agent_info_matches_catalog_entry(self):
+        registry = AgentRegistry()
+        registry.register_pipeline_agents(
+            {"StoryAgent": _DummyDescriptor("StoryAgent", asset_key="story_blueprint")}
+        )
+        info = registry.get_agent_info("StoryAgent")
+        assert info is registry.gather_agents_info()["agents"][0]
+        assert info["capabilities"] == ["pipeline_agent", "story_blueprint"]
+        assert registry.get_agent_info("UnknownAgent") is None
+        registry.reload()
+        assert registry.get_agent_info("StoryAgent") is None
+
 
 class TestLLMClientImport:
     def test_llm_client_importable(self):
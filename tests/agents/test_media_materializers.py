@@ -58,7 +58,7 @@ from inference.generation.video_generators.service import FalVideoService
 from inference.generation.video_generators.service import VideoService
 
 
-class _CaptureVideoService:
+class _CaptureVideoService(VideoService):
     def __init__(self) -> None:
         self.generate_calls: list[dict] = []
 
@@ -800,6 +800,27 @@ def test_fal_video_service_includes_structured_constraints_when_configured():
     assert svc.submitted[0]["consistency_constraints"]["consistency_type"] == "entity_anchor_constraints"
 
 
+def test_video_service_generate_clips_batch_keeps_order_and_isolates_failures():
+    class _PartlyFailingVideoService(VideoService):
+        async def generate_clip(self, *, shot_id: str, **kwargs) -> bytes:
+            if shot_id == "sh_002":
+                raise RuntimeError("backend rejected sh_002")
+            return f"clip:{shot_id}".encode()
+
+    results = asyncio.run(
+        _PartlyFailingVideoService().generate_clips_batch(
+            [
+                {"shot_id": "sh_001", "keyframe_images": [], "prompt": "a", "duration_sec": 1.0},
+                {"shot_id": "sh_002", "keyframe_images": [], "prompt": "b", "duration_sec": 1.0},
+                {"shot_id": "sh_003", "keyframe_images": [], "prompt": "c", "duration_sec": 1.0},
+            ]
+        )
+    )
+    assert results[0] == b"clip:sh_001"
+    assert isinstance(results[1], RuntimeError)
+    assert results[2] == b"clip:sh_003"
+
+
 @pytest.mark.skipif(
     shutil.which("ffmpeg") is None or shutil.which("ffprobe") is None,
     reason="ffmpeg/ffprobe required for video concat duration check",
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import gzip
+import json
 import sys
 import types
 from pathlib import Path
@@ -107,6 +109,12 @@ class _DummyRegistry:
             "agent_ids": [agent["id"] for agent in agents],
         }
 
+    def get_agent_info(self, agent_id: str):
+        for agent in self.gather_agents_info()["agents"]:
+            if agent["id"] == agent_id:
+                return agent
+        return None
+
 
 class _ProducerDescriptor:
     agent_id = "ProducerAgent"
@@ -146,6 +154,13 @@ class _ConsumerDescriptor:
         }
 
 
+class _InlineExecutor:
+    """Runs submitted jobs on the calling thread so background routes are deterministic."""
+
+    def submit(self, fn, *args, **kwargs):
+        fn(*args, **kwargs)
+
+
 @pytest.fixture
 def assistant_http_client(tmp_path, monkeypatch):
     storage = AssistantStateStore(runtime_base_path=tmp_path / "Runtime")
@@ -365,6 +380,198 @@ def test_assistant_execute_invalid_execute_fields_type_returns_400(assistant_htt
     assert "execute_fields" in bad.get_json().get("error", "")
 
 
+def test_assistant_execute_rejects_malformed_json_body_with_json_error(assistant_http_client):
+    client = assistant_http_client
+    bad = client.post(
+        "/api/assistant/execute",
+        data="{not json",
+        content_type="application/json",
+    )
+    assert bad.status_code == 400
+    assert bad.get_json() == {"error": "Invalid JSON body"}
+
+    # Bodies are decoded regardless of Content-Type.
+    missing = client.post("/api/assistant/execute", data='{"agent_id": "DummyAgent"}')
+    assert missing.status_code == 400
+    assert "task_id" in missing.get_json()["error"]
+
+
+def test_assistant_execute_call_async_returns_202_and_polls(assistant_http_client, monkeypatch):
+    client = assistant_http_client
+    monkeypatch.setattr(
+        service_module.AssistantService,
+        "_get_background_executor",
+        lambda self: _InlineExecutor(),
+    )
+    create_task_resp = client.post(
+        "/api/tasks/create",
+        json={"description": {"goal": "background run"}},
+    )
+    assert create_task_resp.status_code == 201
+    task_id = create_task_resp.get_json()["id"]
+
+    unknown = client.post(
+        "/api/assistant/execute/call-async",
+        json={"agent_id": "NoSuchAgent", "task_id": task_id},
+    )
+    assert unknown.status_code == 404
+
+    queued = client.post(
+        "/api/assistant/execute/call-async",
+        json={"agent_id": "DummyAgent", "task_id": task_id, "execute_fields": {}},
+    )
+    assert queued.status_code == 202
+    body = queued.get_json()
+    assert body["task_id"] == task_id
+    execution_id = body["execution_id"]
+
+    poll = client.get(f"/api/assistant/executions/{execution_id}")
+    assert poll.status_code == 200
+    assert poll.get_json()["status"] == "COMPLETED"
+    unchanged = client.get(
+        f"/api/assistant/executions/{execution_id}",
+        headers={"If-None-Match": poll.headers["ETag"]},
+    )
+    assert unchanged.status_code == 304
+    listed = client.get(f"/api/assistant/executions/task/{task_id}").get_json()
+    assert [item["id"] for item in listed] == [execution_id]
+    assert client.get("/api/assistant/executions/exec_missing").status_code == 404
+
+
+def test_assistant_execute_call_async_marks_persist_failure_failed(
+    assistant_http_client, monkeypatch
+):
+    client = assistant_http_client
+    monkeypatch.setattr(
+        service_module.AssistantService,
+        "_get_background_executor",
+        lambda self: _InlineExecutor(),
+    )
+
+    def _persist_fails(self, execution, workspace, *, overwrite_existing_assets=False):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(service_module.AssistantService, "process_results", _persist_fails)
+    task_id = client.post(
+        "/api/tasks/create",
+        json={"description": {"goal": "persist failure"}},
+    ).get_json()["id"]
+
+    queued = client.post(
+        "/api/assistant/execute/call-async",
+        json={"agent_id": "DummyAgent", "task_id": task_id, "execute_fields": {}},
+    )
+    assert queued.status_code == 202
+
+    record = client.get(
+        f"/api/assistant/executions/{queued.get_json()['execution_id']}"
+    ).get_json()
+    assert record["status"] == "FAILED"
+    assert record["error"] == "disk full"
+    assert record["completed_at"] is not None
+
+
+def test_assistant_read_endpoints_answer_304_for_matching_etag(assistant_http_client):
+    client = assistant_http_client
+
+    first = client.get("/api/assistant/sub-agents")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    cached = client.get("/api/assistant/sub-agents", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.data == b""
+    assert client.get(
+        "/api/assistant/sub-agents/DummyAgent", headers={"If-None-Match": etag}
+    ).status_code == 200
+
+    assistant = client.get("/api/assistant")
+    assert assistant.status_code == 200
+    assert client.get(
+        "/api/assistant", headers={"If-None-Match": assistant.headers["ETag"]}
+    ).status_code == 304
+
+    brief = client.get("/api/assistant/workspace/memory/brief")
+    assert brief.status_code == 200
+    brief_etag = brief.headers["ETag"]
+    assert client.get(
+        "/api/assistant/workspace/memory/brief", headers={"If-None-Match": brief_etag}
+    ).status_code == 304
+    assert client.get(
+        "/api/assistant/workspace/memory/brief?limit=0",
+        headers={"If-None-Match": brief_etag},
+    ).status_code == 200
+
+    added = client.post(
+        "/api/assistant/workspace/memory/entries",
+        json={"content": "etag note", "task_id": "task_etag", "agent_id": "DummyAgent"},
+    )
+    assert added.status_code == 201
+    changed = client.get(
+        "/api/assistant/workspace/memory/brief", headers={"If-None-Match": brief_etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != brief_etag
+
+
+def test_assistant_workspace_listings_stream_ndjson(assistant_http_client):
+    client = assistant_http_client
+    added = client.post(
+        "/api/assistant/workspace/memory/entries",
+        json={"content": "ndjson note", "task_id": "task_ndjson", "agent_id": "DummyAgent"},
+    )
+    assert added.status_code == 201
+
+    logs = client.get("/api/assistant/workspace/logs?stream=ndjson")
+    assert logs.status_code == 200
+    assert logs.mimetype == "application/x-ndjson"
+    lines = logs.get_data(as_text=True).splitlines()
+    assert lines
+    assert [json.loads(line) for line in lines] == client.get(
+        "/api/assistant/workspace/logs"
+    ).get_json()
+
+    files = client.get("/api/assistant/workspace/files?stream=ndjson")
+    assert files.status_code == 200
+    assert files.mimetype == "application/x-ndjson"
+    assert [json.loads(line) for line in files.get_data(as_text=True).splitlines()] == (
+        client.get("/api/assistant/workspace/files").get_json()
+    )
+
+
+def test_assistant_workspace_logs_gzip_limited_pages_and_stream_the_rest(
+    assistant_http_client, monkeypatch
+):
+    client = assistant_http_client
+    for i in range(20):
+        added = client.post(
+            "/api/assistant/workspace/memory/entries",
+            json={"content": f"log note {i}", "task_id": "task_logs", "agent_id": "DummyAgent"},
+        )
+        assert added.status_code == 201
+    gzip_headers = {"Accept-Encoding": "gzip"}
+    all_logs = client.get("/api/assistant/workspace/logs").get_json()
+    assert len(all_logs) >= 20
+
+    # Without a limit the listing streams, so the gzip hook leaves it alone.
+    unlimited = client.get("/api/assistant/workspace/logs", headers=gzip_headers)
+    assert unlimited.status_code == 200
+    assert "Content-Encoding" not in unlimited.headers
+    assert unlimited.get_json() == all_logs
+
+    # A limited page that fits in one batch is a single, compressed body.
+    page = client.get("/api/assistant/workspace/logs?limit=20", headers=gzip_headers)
+    assert page.status_code == 200
+    assert page.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(page.get_data())) == all_logs[:20]
+
+    # A limited result larger than one batch streams again.
+    monkeypatch.setattr(routes_module, "_STREAM_BATCH_SIZE", 4)
+    large = client.get("/api/assistant/workspace/logs?limit=20", headers=gzip_headers)
+    assert large.status_code == 200
+    assert "Content-Encoding" not in large.headers
+    assert large.get_json() == all_logs[:20]
+
+
 def test_assistant_pipeline_http_flow_reuses_previous_agent_asset(
     assistant_http_client_pipeline,
 ):
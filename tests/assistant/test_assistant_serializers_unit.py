@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime
+from enum import IntEnum
 
 from src.assistant.models import Assistant, AgentExecution, ExecutionStatus
 from src.assistant.response_serializers import (
+    dumps_response_value,
     file_metadata_to_dict,
     log_entry_to_dict,
     serialize_response_value,
@@ -69,6 +72,17 @@ def test_serializers_file_and_log_dict_helpers():
     assert full_file["file_extension"] == ".txt"
     assert full_file["size_bytes"] == 3
     assert log_dict["resource_type"] == "file"
+    assert full_file["created_at"] == now.isoformat()
+    assert log_dict["timestamp"] == now.isoformat()
+
+    # Routes encode the dataclasses directly; the wire shape matches the helpers.
+    assert json.loads(dumps_response_value(file_meta)) == full_file
+    assert json.loads(dumps_response_value([log])) == [log_dict]
+
+    # The cached ISO string follows reassignment of the timestamp field.
+    later = datetime(2030, 1, 2, 3, 4, 5)
+    file_meta.created_at = later
+    assert file_metadata_to_dict(file_meta)["created_at"] == later.isoformat()
 
 
 def test_serialize_response_value_rewrites_binary_payloads():
@@ -76,3 +90,42 @@ def test_serialize_response_value_rewrites_binary_payloads():
     serialized = serialize_response_value(payload)
     assert serialized["raw"] == {"_type": "binary", "size_bytes": 2}
     assert serialized["nested"]["buf"] == {"_type": "binary", "size_bytes": 3}
+
+
+def test_dumps_response_value_matches_serialize_response_value():
+    execution = AgentExecution(
+        id="exec_1",
+        assistant_id="assistant_global",
+        agent_id="a1",
+        task_id="t1",
+        status=ExecutionStatus.FAILED,
+        inputs={"text": "draft"},
+        results={"raw": b"\x01\x02", "rows": [{"at": datetime(2030, 1, 2, 3, 4, 5, 6)}]},
+        error="boom",
+        started_at=datetime(2030, 1, 2, 3, 4, 5),
+    )
+    encoded = dumps_response_value([execution])
+    assert json.loads(encoded) == [serialize_response_value(execution)]
+    assert encoded.endswith(b"\n")
+    assert list(json.loads(dumps_response_value({"b": 1, "a": 2}))) == ["b", "a"]
+    assert list(json.loads(dumps_response_value({"b": 1, "a": 2}, sort_keys=True))) == ["a", "b"]
+
+
+def test_serialize_response_value_dispatch_keeps_subclass_precedence():
+    class Level(IntEnum):
+        HIGH = 2
+
+    class MyDict(dict):
+        pass
+
+    stamp = datetime(2030, 1, 2, 3, 4, 5)
+    payload = MyDict(level=Level.HIGH, rows=[True, None, 1.5, ("t",)], at=stamp)
+    # Twice: the second call goes through the cached per-type handlers.
+    for _ in range(2):
+        serialized = serialize_response_value(payload)
+        assert serialized == {
+            "level": 2,
+            "rows": [True, None, 1.5, ("t",)],
+            "at": stamp.isoformat(),
+        }
+        assert type(serialized["level"]) is int
@@ -706,6 +706,43 @@ def test_service_build_execution_inputs_includes_global_memory_list(assistant_en
     assert gm[0].get("agent_id") == "DummyAgent"
 
 
+def test_state_store_executions_by_task_follow_creation_and_task_change(tmp_path):
+    storage = AssistantStateStore(runtime_base_path=tmp_path / "Runtime")
+    first = storage.create_execution("A", "task_1", {})
+    other = storage.create_execution("B", "task_2", {})
+    second = storage.create_execution("C", "task_1", {})
+
+    assert [e.id for e in storage.get_executions_by_task("task_1")] == [first.id, second.id]
+    assert storage.get_executions_by_task("missing") == []
+
+    first.status = ExecutionStatus.COMPLETED
+    assert storage.update_execution(first) is True
+    assert storage.get_executions_by_task("task_1")[0].status == ExecutionStatus.COMPLETED
+
+    other.task_id = "task_1"
+    assert storage.update_execution(other) is True
+    assert [e.id for e in storage.get_executions_by_task("task_1")] == [
+        first.id, other.id, second.id,
+    ]
+    assert storage.get_executions_by_task("task_2") == []
+
+
+def test_state_store_fail_execution_swaps_in_failed_record(tmp_path):
+    storage = AssistantStateStore(runtime_base_path=tmp_path / "Runtime")
+    execution = storage.create_execution("A", "task_1", {})
+    execution.status = ExecutionStatus.COMPLETED
+
+    failed = storage.fail_execution(execution.id, "persist failed")
+    assert failed is not execution
+    assert execution.status == ExecutionStatus.COMPLETED
+    assert storage.get_execution(execution.id) is failed
+    assert failed.status == ExecutionStatus.FAILED
+    assert failed.error == "persist failed"
+    assert failed.completed_at is not None
+    assert storage.get_executions_by_task("task_1") == [failed]
+    assert storage.fail_execution("exec_missing", "x") is None
+
+
 def test_artifact_media_type_subdir():
     S = service_module.AssistantService._artifact_media_type_subdir
     assert S("clip.mp4") == "video"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from types import SimpleNamespace
 
 import pytest
@@ -8,6 +9,7 @@ from src.assistant.workspace.asset_manager import AssetManager
 from src.assistant.workspace.file_manager import FileManager
 from src.assistant.workspace.log_manager import LogManager
 from src.assistant.workspace.memory_manager import MemoryManager
+from src.assistant.workspace.workspace import Workspace
 
 
 def _build_asset_manager(fm: FileManager, lm: LogManager) -> AssetManager:
@@ -32,6 +34,105 @@ def test_file_manager_list(tmp_path):
     listed = fm.list_files()
     assert len(listed) == 2
 
+    listed.clear()
+    third = fm.store_file_at_relative_path("notes/c.txt", b"three", "c.txt", "gamma")
+    relisted = fm.list_files()
+    assert len(relisted) == 3
+    assert relisted[0].id == third.id
+    fm.delete_file(third.id)
+    assert [m.id for m in fm.list_files()] == [m.id for m in relisted[1:]]
+
+
+def test_file_manager_metadata_round_trips_after_reload_and_delete(tmp_path):
+    fm = FileManager("ws_1", tmp_path)
+    first = fm.store_file_at_relative_path("notes/a.txt", b"one", "a.txt", "alpha")
+    second = fm.store_file_at_relative_path("notes/b.txt", b"two", "b.txt", "beta")
+
+    reloaded = FileManager("ws_1", tmp_path)
+    reloaded.store_file_at_relative_path("notes/c.txt", b"three", "c.txt", "gamma")
+    assert reloaded.delete_file(first.id) is True
+
+    data = json.loads((tmp_path / "ws_1" / ".file_metadata.json").read_text(encoding="utf-8"))
+    assert first.id not in data["files"]
+    assert data["files"][second.id]["description"] == "beta"
+    assert data["files"][second.id]["created_at"] == second.created_at.isoformat()
+    assert len(data["files"]) == 2
+
+
+def test_file_manager_update_file_is_saved_and_listed(tmp_path):
+    fm = FileManager("ws_1", tmp_path)
+    first = fm.store_file_at_relative_path(
+        "notes/a.txt", b"one", "a.txt", "alpha",
+        metadata={"task_id": "t1", "producer_agent_id": "StoryAgent"},
+    )
+    fm.store_file_at_relative_path("notes/b.txt", b"two", "b.txt", "beta")
+
+    updated = fm.update_file(
+        first.id,
+        description="alpha v2",
+        tags=["draft"],
+        metadata={"task_id": "t2", "producer_agent_id": "StoryAgent"},
+    )
+    assert updated is first
+    assert fm.update_file("file_missing", description="x") is None
+    # A later save must not write back the entry cached before the update.
+    fm.store_file_at_relative_path("notes/c.txt", b"three", "c.txt", "gamma")
+
+    listed = {f.id: f for f in fm.list_files()}
+    assert listed[first.id].description == "alpha v2"
+    assert [f.id for f in fm.list_files_by_producer("t2", "StoryAgent")] == [first.id]
+    assert fm.list_files_by_producer("t1", "StoryAgent") == []
+
+    reloaded = {f.id: f for f in FileManager("ws_1", tmp_path).list_files()}
+    assert reloaded[first.id].description == "alpha v2"
+    assert reloaded[first.id].tags == ["draft"]
+    assert reloaded[first.id].metadata["task_id"] == "t2"
+
+
+def test_file_manager_delete_files_saves_metadata_once(tmp_path, monkeypatch):
+    fm = FileManager("ws_1", tmp_path)
+    a = fm.store_file_at_relative_path("notes/a.txt", b"one", "a.txt", "alpha")
+    b = fm.store_file_at_relative_path("notes/b.txt", b"two", "b.txt", "beta")
+    c = fm.store_file_at_relative_path("notes/c.txt", b"three", "c.txt", "gamma")
+
+    saves: list[int] = []
+    original = FileManager._save_metadata
+
+    def _counting_save(self):
+        saves.append(1)
+        return original(self)
+
+    monkeypatch.setattr(FileManager, "_save_metadata", _counting_save)
+
+    deleted = fm.delete_files([a.id, "file_missing", c.id])
+    assert [m.id for m in deleted] == [a.id, c.id]
+    assert len(saves) == 1
+    assert [m.id for m in fm.list_files()] == [b.id]
+    assert not (tmp_path / "ws_1" / "notes" / "a.txt").exists()
+    assert fm.delete_files(["file_missing"]) == []
+    assert len(saves) == 1
+
+
+def test_file_manager_list_files_by_producer_tracks_store_delete_and_reload(tmp_path):
+    fm = FileManager("ws_1", tmp_path)
+    producer = {"task_id": "t1", "producer_agent_id": "VideoAgent", "asset_key": "video"}
+    a = fm.store_file_at_relative_path("x/a.json", b"{}", "a.json", "a", metadata=dict(producer))
+    b = fm.store_file_at_relative_path("x/b.json", b"{}", "b.json", "b", metadata=dict(producer))
+    fm.store_file_at_relative_path(
+        "x/c.json", b"{}", "c.json", "c", metadata={"task_id": "t1", "producer_agent_id": "AudioAgent"}
+    )
+    fm.store_file_at_relative_path("x/d.txt", b"d", "d.txt", "no producer")
+
+    assert {m.id for m in fm.list_files_by_producer("t1", "VideoAgent")} == {a.id, b.id}
+    assert fm.list_files_by_producer("t2", "VideoAgent") == []
+
+    fm.delete_files([a.id])
+    assert [m.id for m in fm.list_files_by_producer("t1", "VideoAgent")] == [b.id]
+
+    reloaded = FileManager("ws_1", tmp_path)
+    assert [m.id for m in reloaded.list_files_by_producer("t1", "VideoAgent")] == [b.id]
+    assert len(reloaded.list_files_by_producer("t1", "AudioAgent")) == 1
+
 
 def test_file_manager_read_binary_from_uri(tmp_path):
     fm = FileManager("ws_1", tmp_path)
@@ -172,6 +273,83 @@ def test_global_memory_md_created_empty_then_sections_after_entry(tmp_path):
     assert listed[0]["content"] == "hello"
 
 
+def test_memory_manager_caches_entries_until_file_changes(tmp_path, monkeypatch):
+    mm = MemoryManager("ws_cache", tmp_path)
+    mm.add_memory_entry(content="first", task_id="task_c", agent_id="StoryAgent")
+
+    reads: list[object] = []
+    original = MemoryManager._read_entries_from_file
+
+    def _counting_read(self, path):
+        reads.append(path)
+        return original(self, path)
+
+    monkeypatch.setattr(MemoryManager, "_read_entries_from_file", _counting_read)
+
+    assert [e["content"] for e in mm.list_memory_entries(task_id="task_c")] == ["first"]
+    mm.get_memory_brief(task_id="task_c")
+    assert reads == []
+
+    # A write from another manager instance changes the file on disk.
+    other = MemoryManager("ws_cache", tmp_path)
+    other.add_memory_entry(content="second, from elsewhere", task_id="task_c")
+    listed = mm.list_memory_entries(task_id="task_c")
+    assert [e["content"] for e in listed] == ["first", "second, from elsewhere"]
+    assert len(reads) >= 1
+
+
+def test_memory_manager_refresh_skips_unchanged_file_and_tracks_version(tmp_path, monkeypatch):
+    mm = MemoryManager("ws_ver", tmp_path)
+    mm.add_memory_entry(content="first", task_id="task_v", agent_id="StoryAgent")
+    version = mm.memory_version()
+
+    writes: list[object] = []
+    original = MemoryManager._write_global_memory_file
+
+    def _counting_write(self, path, entries):
+        writes.append(path)
+        return original(self, path, entries)
+
+    monkeypatch.setattr(MemoryManager, "_write_global_memory_file", _counting_write)
+
+    mm.refresh_file_tree()
+    assert writes == []
+    assert mm.memory_version() == version
+    assert len(mm.get_memory_brief(task_id="task_v", limit=0)["global_memory"]) == 1
+
+    other = MemoryManager("ws_ver", tmp_path)
+    other.add_memory_entry(content="second", task_id="task_v", agent_id="VideoAgent")
+    assert mm.memory_version() != version
+    brief = mm.get_memory_brief(task_id="task_v", limit=0)["global_memory"]
+    assert [row["agent_id"] for row in brief] == ["VideoAgent", "StoryAgent"]
+    mm.refresh_file_tree()
+    assert len(writes) == 2
+
+
+def test_workspace_file_tree_text_is_cached_until_facade_write(tmp_path, monkeypatch):
+    ws = Workspace("ws_tree", tmp_path)
+    walks: list[int] = []
+    original = MemoryManager.workspace_root_file_tree_text
+
+    def _counting_tree(self):
+        walks.append(1)
+        return original(self)
+
+    monkeypatch.setattr(MemoryManager, "workspace_root_file_tree_text", _counting_tree)
+
+    first = ws.get_workspace_root_file_tree_text()
+    assert ws.get_workspace_root_file_tree_text() == first
+    assert len(walks) == 1
+
+    ws.store_file_at_relative_path("artifacts/a.txt", b"a", "a.txt", "alpha")
+    assert "a.txt" in ws.get_workspace_root_file_tree_text()
+    assert len(walks) == 2
+
+    (tmp_path / "ws_tree" / "outside.txt").write_text("x", encoding="utf-8")
+    monkeypatch.setattr(Workspace, "FILE_TREE_CACHE_TTL_SEC", 0.0)
+    assert "outside.txt" in ws.get_workspace_root_file_tree_text()
+
+
 def test_log_manager_filter(tmp_path):
     lm = LogManager("ws_1", tmp_path)
     lm.add_log("write", "file", details={"msg": "hello"}, agent_id="a1", task_id="t1")
@@ -183,6 +361,25 @@ def test_log_manager_filter(tmp_path):
     assert filtered[0].operation_type == "write"
 
 
+def test_log_manager_indexed_filters_survive_reload(tmp_path):
+    lm = LogManager("ws_1", tmp_path)
+    lm.add_log("write", "file", agent_id="a1", task_id="t1")
+    lm.add_log("read", "file", agent_id="a1", task_id="t2")
+    lm.add_log("write", "memory", agent_id="a2", task_id="t1")
+    lm.add_log("create", "workspace")
+
+    reloaded = LogManager("ws_1", tmp_path)
+    for manager in (lm, reloaded):
+        assert len(manager.get_logs(agent_id="a1")) == 2
+        assert len(manager.get_logs(task_id="t1")) == 2
+        both = manager.get_logs(agent_id="a1", task_id="t1")
+        assert [(e.agent_id, e.task_id) for e in both] == [("a1", "t1")]
+        assert manager.get_logs(agent_id="missing") == []
+        assert len(manager.get_logs()) == 4
+        newest = manager.get_logs(limit=2)
+        assert newest == manager.get_logs()[:2]
+
+
 def test_asset_manager_hydrate_and_persist_index(tmp_path):
     fm = FileManager("ws_1", tmp_path)
     lm = LogManager("ws_1", tmp_path)
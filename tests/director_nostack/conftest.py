@@ -93,6 +93,12 @@ class E2eDummyRegistry:
             "agent_ids": [a["id"] for a in agents],
         }
 
+    def get_agent_info(self, agent_id: str):
+        for agent in self.gather_agents_info()["agents"]:
+            if agent["id"] == agent_id:
+                return agent
+        return None
+
 
 @pytest.fixture(autouse=True)
 def _nostack_http_e2e_ignore_shell_real_agents(monkeypatch, request):